@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""Load test: fetch_all_feeds and extract_full_texts against synthetic feeds.
+
+Generates N synthetic RSS/Atom feeds and article pages (mixed sizes,
+encodings, full-content feeds), serves them from a local aiohttp stub
+with configurable latency and error rates, and drives the real fetch
+stage against them. Feeds are spread over loopback addresses
+(127.0.x.y) so the per-host scheduler sees many publishers.
+
+Each scale runs in its own process with a throwaway database, so peak
+RSS is per scale:
+
+    python benchmarks/bench_fetch_load.py [--scales 35,500,5000]
+        [--latency-ms 150] [--error-rate 0.02] [--pages 300] [--json out.json]
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from functools import lru_cache
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+# Add project root to path for imports
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+import yaml
+from aiohttp import web
+
+DEFAULT_PORT = 8790
+CATEGORIES = ("tech_ai", "finance", "geopolitics", "montreal", "quebec", "canada", "wildcards")
+# Weighted toward UTF-8, like the real source list
+ENCODINGS = ("utf-8", "utf-8", "utf-8", "utf-8", "iso-8859-1", "windows-1252")
+WORDS = (
+    "market rates bank inflation model training open source release city council "
+    "transit budget election minister policy trade tariff energy climate research "
+    "startup funding chip data privacy court ruling housing rent strike union "
+    "hôpital québécois élection économie société réseau métro été ministère"
+).split()
+
+
+# ---------------------------------------------------------------------------
+# Synthetic corpus
+# ---------------------------------------------------------------------------
+
+def host_ips(n_hosts: int) -> list[str]:
+    """Loopback addresses standing in for n_hosts publishers."""
+    return [f"127.0.{i // 250 + 1}.{i % 250 + 1}" for i in range(n_hosts)]
+
+
+def n_hosts_for(n_feeds: int, feeds_per_host: int, max_hosts: int) -> int:
+    return max(1, min(max_hosts, math.ceil(n_feeds / feeds_per_host)))
+
+
+def feed_spec(seed: int, index: int) -> dict:
+    """Shape of synthetic feed index: format, encoding, entry count, text sizes."""
+    rng = random.Random(f"{seed}:{index}")
+    encoding = rng.choice(ENCODINGS)
+    return {
+        "index": index,
+        "format": "atom" if rng.random() < 0.25 else "rss",
+        "encoding": encoding,
+        "language": "fr" if encoding != "utf-8" or rng.random() < 0.15 else "en",
+        "entries": rng.randint(10, 60),
+        # Most feeds carry a teaser; some ship the whole article
+        "summary_words": rng.choice((25, 40, 60, 120)),
+        "full_content": rng.random() < 0.15,
+        "category": CATEGORIES[index % len(CATEGORIES)],
+        "reliability": round(rng.uniform(0.6, 0.95), 2),
+    }
+
+
+def _sentence(rng: random.Random, n_words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n_words)).capitalize() + "."
+
+
+def _paragraphs(rng: random.Random, n_words: int) -> list[str]:
+    paragraphs, left = [], n_words
+    while left > 0:
+        size = min(left, rng.randint(40, 120))
+        paragraphs.append(" ".join(_sentence(rng, rng.randint(8, 20)) for _ in range(size // 14 + 1)))
+        left -= size
+    return paragraphs
+
+
+@lru_cache(maxsize=256)
+def render_feed(seed: int, index: int, base_url: str) -> tuple[bytes, str]:
+    """(body, content type) of synthetic feed index."""
+    spec = feed_spec(seed, index)
+    rng = random.Random(f"{seed}:{index}:entries")
+    now = datetime.now(timezone.utc)
+
+    items = []
+    for j in range(spec["entries"]):
+        title = escape(_sentence(rng, rng.randint(6, 12)))
+        link = escape(f"{base_url}/article/{index}/{j}")
+        published = now - timedelta(minutes=37 * j + rng.randint(0, 30))
+        summary = escape("<p>" + " ".join(_paragraphs(rng, spec["summary_words"])) + "</p>")
+        content = ""
+        if spec["full_content"]:
+            body = "".join(f"<p>{p}</p>" for p in _paragraphs(rng, rng.randint(400, 1200)))
+            content = escape(body)
+
+        if spec["format"] == "atom":
+            items.append(
+                f"<entry><title>{title}</title><link href=\"{link}\"/><id>{link}</id>"
+                f"<updated>{published.isoformat()}</updated>"
+                f"<summary type=\"html\">{summary}</summary>"
+                + (f"<content type=\"html\">{content}</content>" if content else "")
+                + "</entry>"
+            )
+        else:
+            items.append(
+                f"<item><title>{title}</title><link>{link}</link><guid>{link}</guid>"
+                f"<pubDate>{format_datetime(published)}</pubDate>"
+                f"<description>{summary}</description>"
+                + (f"<content:encoded>{content}</content:encoded>" if content else "")
+                + "</item>"
+            )
+
+    encoding = spec["encoding"]
+    if spec["format"] == "atom":
+        xml = (f'<?xml version="1.0" encoding="{encoding}"?>'
+               f'<feed xmlns="http://www.w3.org/2005/Atom"><title>Synthetic {index}</title>'
+               f'{"".join(items)}</feed>')
+        content_type = f"application/atom+xml; charset={encoding}"
+    else:
+        xml = (f'<?xml version="1.0" encoding="{encoding}"?>'
+               f'<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">'
+               f'<channel><title>Synthetic {index}</title>{"".join(items)}</channel></rss>')
+        content_type = f"application/rss+xml; charset={encoding}"
+    return xml.encode(encoding, errors="xmlcharrefreplace"), content_type
+
+
+def render_page(seed: int, index: int, entry: int) -> tuple[bytes, str]:
+    """(body, content type) of an article page: boilerplate-heavy, 30-400 KB."""
+    spec = feed_spec(seed, index)
+    rng = random.Random(f"{seed}:{index}:{entry}:page")
+    encoding = spec["encoding"]
+
+    article = "".join(f"<p>{p}</p>" for p in _paragraphs(rng, rng.randint(300, 1500)))
+    nav = "".join(f'<li><a href="/section/{k}">{rng.choice(WORDS)}</a></li>' for k in range(rng.randint(20, 120)))
+    # Inline scripts and tracking blobs are most of a real page's weight
+    script = "var _cfg=" + json.dumps({"k": [rng.random() for _ in range(rng.randint(500, 12000))]}) + ";"
+    html = (
+        f'<!DOCTYPE html><html lang="{spec["language"]}"><head>'
+        f'<meta charset="{encoding}"><title>{_sentence(rng, 8)}</title>'
+        f'<script>{script}</script></head><body><nav><ul>{nav}</ul></nav>'
+        f'<article><h1>{_sentence(rng, 9)}</h1>{article}</article>'
+        f'<footer>{_sentence(rng, 30)}</footer></body></html>'
+    )
+    return html.encode(encoding, errors="xmlcharrefreplace"), f"text/html; charset={encoding}"
+
+
+# ---------------------------------------------------------------------------
+# Stub server
+# ---------------------------------------------------------------------------
+
+def make_app(seed: int, latency_ms: float, error_rate: float) -> web.Application:
+    """Serve /feed/{i} and /article/{i}/{j} with lognormal latency and injected errors."""
+    rng = random.Random(seed)
+
+    async def _delay_or_fail(request):
+        if latency_ms:
+            await asyncio.sleep(rng.lognormvariate(math.log(latency_ms / 1000), 0.6))
+        if rng.random() < error_rate:
+            failure = rng.choice((500, 404, 429, None))
+            if failure is None:
+                await asyncio.sleep(120)  # Hang past the fetcher's timeout
+            raise _http_error(failure or 500)
+
+    async def feed(request):
+        await _delay_or_fail(request)
+        base_url = f"http://{request.host}"
+        body, content_type = render_feed(seed, int(request.match_info["index"]), base_url)
+        return web.Response(body=body, headers={"Content-Type": content_type})
+
+    async def article(request):
+        await _delay_or_fail(request)
+        body, content_type = render_page(
+            seed, int(request.match_info["index"]), int(request.match_info["entry"]),
+        )
+        return web.Response(body=body, headers={"Content-Type": content_type})
+
+    app = web.Application()
+    app.router.add_get("/feed/{index}", feed)
+    app.router.add_get("/article/{index}/{entry}", article)
+    return app
+
+
+def _http_error(status: int) -> web.HTTPException:
+    return {500: web.HTTPInternalServerError, 404: web.HTTPNotFound,
+            429: web.HTTPTooManyRequests}[status]()
+
+
+async def serve(args):
+    runner = web.AppRunner(make_app(args.seed, args.latency_ms, args.error_rate), access_log=None)
+    await runner.setup()
+    for ip in host_ips(n_hosts_for(args.feeds, args.feeds_per_host, args.max_hosts)):
+        await web.TCPSite(runner, ip, args.port).start()
+    await asyncio.Event().wait()
+
+
+def wait_for_port(host: str, port: int, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"stub server did not start on {host}:{port}")
+
+
+# ---------------------------------------------------------------------------
+# Fetcher run (one scale, in its own process)
+# ---------------------------------------------------------------------------
+
+def _percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def _latencies(rows: list[dict], kind: str) -> dict:
+    rows = [r for r in rows if r.get("kind") == kind]
+    totals = [r["total"] for r in rows]
+    return {
+        "requests": len(totals),
+        "errors": sum(1 for r in rows if r.get("error") or (r.get("status") or 0) >= 400),
+        "p50_ms": round(_percentile(totals, 0.50) * 1000, 1),
+        "p99_ms": round(_percentile(totals, 0.99) * 1000, 1),
+    }
+
+
+def write_feeds_config(path: Path, args, telemetry_dir: Path):
+    """feeds.yaml for the synthetic sources, with the real fetch settings."""
+    real = yaml.safe_load((ROOT / "config" / "feeds.yaml").read_text())
+    fetch = dict(real.get("fetch", {}))
+    # Measure the fetcher, not the stage budget
+    fetch.pop("feed_stage_budget", None)
+    fetch.pop("extract_stage_budget", None)
+    fetch["telemetry_dir"] = str(telemetry_dir)
+
+    ips = host_ips(n_hosts_for(args.feeds, args.feeds_per_host, args.max_hosts))
+    sources: dict[str, list] = {}
+    for i in range(args.feeds):
+        spec = feed_spec(args.seed, i)
+        sources.setdefault(spec["category"], []).append({
+            "name": f"synthetic-{i:05d}",
+            "url": f"http://{ips[i % len(ips)]}:{args.port}/feed/{i}",
+            "language": spec["language"],
+            "reliability": spec["reliability"],
+        })
+    path.write_text(yaml.safe_dump({"sources": sources, "fetch": fetch}))
+    return fetch
+
+
+async def run_scale(args) -> dict:
+    from src.fetcher import extract_full_texts, fetch_all_feeds
+    from src.scheduler import HostScheduler
+    from src.telemetry import FetchTelemetry
+
+    work = Path(args.workdir)
+    config_path = work / "feeds.yaml"
+    fetch = write_feeds_config(config_path, args, work / "telemetry")
+
+    started = time.monotonic()
+    articles = await fetch_all_feeds(str(config_path))
+    fetch_seconds = time.monotonic() - started
+    report = json.loads(next((work / "telemetry").glob("fetch-*.json")).read_text())
+
+    # Extraction on its own: pages without text, cache bypassed
+    sample = [a for a in articles if not a.full_text][:args.pages]
+    telemetry = FetchTelemetry()
+    scheduler = HostScheduler(
+        max_concurrency=fetch.get("max_concurrency", 10),
+        per_host=fetch.get("per_host_concurrency", 2),
+    )
+    started = time.monotonic()
+    await extract_full_texts(
+        sample, max_articles=len(sample), cache_ttl_hours=0, failure_ttl_hours=0,
+        timeout=fetch.get("timeout", 30), scheduler=scheduler,
+        max_page_bytes=fetch.get("max_page_bytes"), telemetry=telemetry,
+    )
+    extract_seconds = time.monotonic() - started
+
+    return {
+        "feeds": args.feeds,
+        "hosts": n_hosts_for(args.feeds, args.feeds_per_host, args.max_hosts),
+        "articles": len(articles),
+        "fetch_seconds": round(fetch_seconds, 2),
+        "feeds_per_second": round(args.feeds / fetch_seconds, 1),
+        "feed": _latencies(report["requests"], "feed"),
+        "fetch_phases": report["summary"]["phase_seconds"],
+        "pages": len(sample),
+        "extracted": sum(1 for a in sample if a.full_text),
+        "extract_seconds": round(extract_seconds, 2),
+        "pages_per_second": round(len(sample) / extract_seconds, 1) if extract_seconds else 0.0,
+        "page": _latencies(telemetry.rows(), "page"),
+    }
+
+
+def run_child(args):
+    from src.workers import shutdown_process_pool
+
+    try:
+        result = asyncio.run(run_scale(args))
+    finally:
+        shutdown_process_pool()
+    # ru_maxrss is KB on Linux; children = the largest pool worker
+    result["peak_rss_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    result["peak_worker_rss_mb"] = round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024, 1)
+    print("RESULT " + json.dumps(result))
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+
+def _common_args(args, feeds: int) -> list[str]:
+    return [
+        "--feeds", str(feeds), "--port", str(args.port), "--seed", str(args.seed),
+        "--feeds-per-host", str(args.feeds_per_host), "--max-hosts", str(args.max_hosts),
+    ]
+
+
+def bench_scale(args, feeds: int) -> dict | None:
+    script = str(Path(__file__).resolve())
+    stub = subprocess.Popen(
+        [sys.executable, script, "--serve", *_common_args(args, feeds),
+         "--latency-ms", str(args.latency_ms), "--error-rate", str(args.error_rate)],
+    )
+    try:
+        wait_for_port(host_ips(1)[0], args.port)
+        with tempfile.TemporaryDirectory() as work:
+            env = dict(os.environ, NEWS_DB_PATH=str(Path(work) / "brief.db"))
+            env.pop("NEWS_CASSETTE_MODE", None)
+            proc = subprocess.run(
+                [sys.executable, script, "--run", *_common_args(args, feeds),
+                 "--pages", str(args.pages), "--workdir", work],
+                env=env, cwd=ROOT, capture_output=True, text=True,
+            )
+    finally:
+        stub.terminate()
+        stub.wait()
+
+    for line in proc.stdout.splitlines():
+        if line.startswith("RESULT "):
+            return json.loads(line[len("RESULT "):])
+    print(proc.stdout[-2000:])
+    print(proc.stderr[-2000:])
+    return None
+
+
+def print_results(results: list[dict]):
+    print()
+    print(f"{'feeds':>6} {'hosts':>5} {'articles':>8} {'fetch s':>8} {'feeds/s':>8} "
+          f"{'feed p50/p99 ms':>16} {'err':>4} {'pages':>6} {'pages/s':>8} "
+          f"{'page p50/p99 ms':>16} {'err':>4} {'RSS MB':>7} {'worker':>7}")
+    for r in results:
+        print(f"{r['feeds']:>6} {r['hosts']:>5} {r['articles']:>8} {r['fetch_seconds']:>8.1f} "
+              f"{r['feeds_per_second']:>8.1f} "
+              f"{r['feed']['p50_ms']:>7.0f}/{r['feed']['p99_ms']:<8.0f} {r['feed']['errors']:>4} "
+              f"{r['pages']:>6} {r['pages_per_second']:>8.1f} "
+              f"{r['page']['p50_ms']:>7.0f}/{r['page']['p99_ms']:<8.0f} {r['page']['errors']:>4} "
+              f"{r['peak_rss_mb']:>7.0f} {r['peak_worker_rss_mb']:>7.0f}")
+    for r in results:
+        phases = ", ".join(f"{k} {v:.1f}s" for k, v in r["fetch_phases"].items() if v >= 0.05)
+        print(f"  {r['feeds']} feeds, summed fetch phases: {phases}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", default="35,500,5000", help="Comma-separated feed counts")
+    parser.add_argument("--latency-ms", type=float, default=150, help="Median stub response delay")
+    parser.add_argument("--error-rate", type=float, default=0.02,
+                        help="Fraction of requests failing (500/404/429/hang)")
+    parser.add_argument("--pages", type=int, default=300, help="Pages for the extraction run")
+    parser.add_argument("--feeds-per-host", type=int, default=3)
+    parser.add_argument("--max-hosts", type=int, default=500)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", type=Path, help="Also write results here")
+    # Internal: stub server and per-scale run processes
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--run", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--feeds", type=int, default=35, help=argparse.SUPPRESS)
+    parser.add_argument("--workdir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        asyncio.run(serve(args))
+    elif args.run:
+        run_child(args)
+    else:
+        results = []
+        for feeds in (int(s) for s in args.scales.split(",")):
+            print(f"Benchmarking {feeds} feeds...")
+            result = bench_scale(args, feeds)
+            if result is None:
+                print(f"  [WARN] run at {feeds} feeds failed")
+                continue
+            results.append(result)
+        print_results(results)
+        if args.json:
+            args.json.write_text(json.dumps(results, indent=2))
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Microbenchmark: RSS summary HTML-to-text, BeautifulSoup vs html_to_text.
+
+Runs over a corpus of real feed documents saved as files. Collect one from
+the configured sources first, then benchmark against it offline:
+
+    python benchmarks/bench_html_text.py --collect
+    python benchmarks/bench_html_text.py [--corpus data/feed_corpus] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import aiohttp
+import feedparser
+from bs4 import BeautifulSoup
+
+from src.fetcher import load_feeds_config
+from src.utils.html_text import html_to_text
+
+DEFAULT_CORPUS = Path(__file__).parent.parent / "data" / "feed_corpus"
+
+
+async def collect_corpus(corpus_dir: Path, config_path: str):
+    """Download every configured feed into corpus_dir."""
+    config = load_feeds_config(config_path)
+    fetch_config = config.get("fetch", {})
+    headers = {"User-Agent": fetch_config.get("user_agent", "NewsAggregator/1.0")}
+    corpus_dir.mkdir(parents=True, exist_ok=True)
+
+    async def _save(session, feed):
+        try:
+            async with session.get(feed["url"], timeout=aiohttp.ClientTimeout(total=30)) as resp:
+                if resp.status != 200:
+                    return
+                body = await resp.read()
+        except Exception:
+            return
+        name = hashlib.md5(feed["url"].encode()).hexdigest()[:12]
+        (corpus_dir / f"{name}.xml").write_bytes(body)
+        print(f"  saved {feed['name']} ({len(body) // 1024} KB)")
+
+    feeds = [f for group in config.get("sources", {}).values() for f in group]
+    async with aiohttp.ClientSession(headers=headers) as session:
+        await asyncio.gather(*(_save(session, f) for f in feeds))
+
+
+def load_summaries(corpus_dir: Path) -> list[str]:
+    """Raw summary HTML of every entry in the corpus, as fetch_feed sees it."""
+    summaries = []
+    for path in sorted(corpus_dir.glob("*.xml")):
+        feed = feedparser.parse(path.read_bytes())
+        for entry in feed.entries:
+            if hasattr(entry, "content") and entry.content:
+                summaries.append(entry.content[0].get("value", ""))
+            elif hasattr(entry, "summary"):
+                summaries.append(entry.summary or "")
+            elif hasattr(entry, "description"):
+                summaries.append(entry.description or "")
+    return summaries
+
+
+def _time(fn, summaries: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for html in summaries:
+            fn(html)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(corpus_dir: Path, repeat: int):
+    summaries = load_summaries(corpus_dir)
+    if not summaries:
+        print(f"No feed entries in {corpus_dir}; run with --collect first")
+        return
+
+    total_kb = sum(len(s) for s in summaries) / 1024
+    print(f"Corpus: {len(summaries)} entries, {total_kb:.0f} KB of summary HTML")
+
+    def bs4_text(html):
+        return BeautifulSoup(html, "html.parser").get_text()[:500]
+
+    def fast_text(html):
+        return html_to_text(html, limit=500)
+
+    bs4_time = _time(bs4_text, summaries, repeat)
+    fast_time = _time(fast_text, summaries, repeat)
+
+    mismatches = sum(
+        1 for html in summaries
+        if " ".join(bs4_text(html).split()) != " ".join(fast_text(html).split())
+    )
+
+    n = len(summaries)
+    print(f"  BeautifulSoup : {bs4_time * 1000:8.1f} ms  ({bs4_time / n * 1e6:6.1f} us/entry)")
+    print(f"  html_to_text  : {fast_time * 1000:8.1f} ms  ({fast_time / n * 1e6:6.1f} us/entry)")
+    print(f"  Speedup       : {bs4_time / fast_time:.1f}x")
+    print(f"  Text mismatches (whitespace-normalized): {mismatches}/{n}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument("--collect", action="store_true", help="Download configured feeds first")
+    parser.add_argument("--feeds-config", default="config/feeds.yaml")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.collect:
+        asyncio.run(collect_corpus(args.corpus, args.feeds_config))
+    run(args.corpus, args.repeat)
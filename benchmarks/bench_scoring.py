@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Microbenchmark: calculate_base_score per article vs BatchScorer.
+
+Scores synthetic articles built from the curation config's keywords (plus
+random learned keyword weights) both ways, checks the scores agree (and
+the keyword matcher against a plain substring scan), and times each:
+
+    python benchmarks/bench_scoring.py [--articles 10000] [--learned 40] [--repeat 5]
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.batch_scorer import BatchScorer
+from src.curator import calculate_base_score, load_curation_config
+from src.fetcher import Article
+from src.utils.keywords import HAS_AHOCORASICK
+
+FILLER = ("the of and to in said report after new market year city government week "
+          "people could would officials data plan").split()
+
+SOURCES = [
+    ("https://example.com/news/", 0.8),
+    ("https://arxiv.org/abs/", 0.95),
+    ("https://www.reddit.com/r/x/", 0.6),
+    ("https://wire.example.org/", 0.9),
+]
+
+TITLES = ("{kw} talks resume", "SHOCKING {kw} reveal", "7 WAYS {kw} changes work",
+          "Breaking: {kw} deal signed!", "{kw} outlook for next year")
+
+
+def synthetic_articles(n: int, config: dict, seed: int = 7) -> list[Article]:
+    rng = random.Random(seed)
+    keywords = config.get("user_interests", {}).get("keywords", {})
+    # About one word in twenty is a keyword
+    vocab = [kw for tier in keywords.values() for kw in tier] + FILLER * 80
+    categories = list(config.get("user_interests", {}).get("categories", {})) + ["uncategorized"]
+    now = datetime.now(timezone.utc)
+
+    articles = []
+    for i in range(n):
+        base, reliability = rng.choice(SOURCES)
+        summary = " ".join(rng.choices(vocab, k=rng.randint(10, 60)))
+        roll = rng.random()
+        if roll < 0.4:
+            full_text = ""
+        elif roll < 0.7:
+            full_text = summary * rng.randint(1, 15)
+        else:
+            full_text = f'"{summary}," officials said, up {rng.randint(1, 90)} percent.'
+        articles.append(Article(
+            title=rng.choice(TITLES).format(kw=rng.choice(vocab)),
+            link=f"{base}{i}",
+            summary=summary,
+            source=base,
+            # Minutes past each hour keep ages clear of the recency cut-offs
+            published=now - timedelta(hours=rng.randint(0, 30), minutes=rng.randint(5, 55)),
+            category=rng.choice(categories),
+            language="en",
+            reliability=reliability,
+            full_text=full_text,
+        ))
+    return articles
+
+
+def learned_weights(config: dict, n_keywords: int, seed: int = 7) -> dict:
+    rng = random.Random(seed)
+    keywords = config.get("user_interests", {}).get("keywords", {})
+    vocab = [kw for tier in keywords.values() for kw in tier] + FILLER
+    return {
+        "categories": {c: rng.uniform(0.5, 2.0)
+                       for c in config.get("user_interests", {}).get("categories", {})},
+        "keywords": {kw: rng.uniform(0.2, 3.0)
+                     for kw in rng.sample(vocab, min(n_keywords, len(vocab)))},
+    }
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(n: int, n_learned: int, repeat: int, config_path: str):
+    config = load_curation_config(config_path)
+    weights = learned_weights(config, n_learned)
+    articles = synthetic_articles(n, config)
+    print(f"{n} articles, {len(weights['keywords'])} learned keywords")
+
+    # The matcher against a plain substring scan, for every keyword scored on
+    matcher = BatchScorer(config, weights).matcher
+    texts = [f"{a.title} {a.summary}".lower() for a in articles]
+    if not matcher.word_boundary:
+        mismatches = sum(
+            1 for text in texts
+            if matcher.find(text) != {kw for kw in matcher.keywords if kw in text}
+        )
+        print(f"  Matcher parity ({'Aho-Corasick' if HAS_AHOCORASICK else 'substring scan'}): "
+              f"{mismatches}/{n} differ")
+        if mismatches:
+            sys.exit(1)
+
+    for include_full_text in (True, False):
+        expected = [calculate_base_score(a, config, weights, include_full_text) for a in articles]
+        batch = BatchScorer(config, weights).score(articles, include_full_text)
+        mismatches = sum(1 for e, b in zip(expected, batch) if e != b)
+        worst = max(abs(e - b) for e, b in zip(expected, batch))
+        print(f"  Parity (include_full_text={include_full_text}): "
+              f"{mismatches}/{n} differ, max |diff| {worst:.2e}")
+        if mismatches:
+            sys.exit(1)
+
+    scorer = BatchScorer(config, weights)
+    features = scorer.features(articles)
+    per_article = _best(lambda: [calculate_base_score(a, config, weights) for a in articles], repeat)
+    batch_total = _best(lambda: BatchScorer(config, weights).score(articles), repeat)
+    extract = _best(lambda: scorer.features(articles), repeat)
+    combine = _best(lambda: scorer.score_features(features), repeat)
+
+    print(f"  calculate_base_score : {per_article * 1000:8.1f} ms  ({per_article / n * 1e6:6.2f} us/article)")
+    print(f"  BatchScorer.score    : {batch_total * 1000:8.1f} ms  ({batch_total / n * 1e6:6.2f} us/article)")
+    print(f"    features           : {extract * 1000:8.1f} ms")
+    print(f"    score_features     : {combine * 1000:8.1f} ms")
+    print(f"  Speedup              : {per_article / batch_total:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=10_000)
+    parser.add_argument("--learned", type=int, default=40, help="Learned keyword weights to apply")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--config", default="config/curation.yaml")
+    args = parser.parse_args()
+
+    run(args.articles, args.learned, args.repeat, args.config)
@@ -19,6 +19,9 @@ from .database import (
     record_article_relation,
     get_heard_article_hashes,
 )
+from .batch_scorer import BatchScorer, CLICKBAIT, DATA_POINTS, KEYWORD_TIERS
+from .text_store import release_filtered
+from .utils.keywords import keyword_matcher
 from .utils.reliability import calculate_cross_reference_bonus
 
 
@@ -49,12 +52,15 @@ def load_curation_config(config_path: str = "config/curation.yaml") -> dict:
 def calculate_base_score(
     article: Article,
     config: dict,
-    learned_weights: dict | None = None
+    learned_weights: dict | None = None,
+    include_full_text: bool = True,
 ) -> float:
     """
     Calculate base relevance score for an article.
 
-    Integrates learned weights from user behavior.
+    Integrates learned weights from user behavior. With include_full_text
+    False the content-quality signals are left out entirely, giving the
+    pre-extraction score the extraction planner ranks by.
     """
     score = 0.5  # Start at neutral
 
@@ -74,35 +80,27 @@ def calculate_base_score(
 
     score *= category_weight
 
-    # Keyword matching (static from config)
+    # Keyword matching (static from config), all keywords found in one pass
     keywords = interests.get("keywords", {})
-    text = f"{article.title} {article.summary}".lower()
-
-    for kw in keywords.get("high_priority", []):
-        if kw.lower() in text:
-            score += 0.3
-            break
-
-    for kw in keywords.get("medium_priority", []):
-        if kw.lower() in text:
-            score += 0.2
-            break
+    learned_kw = learned_weights.get("keywords", {}) if learned_weights else {}
+    scoring = config.get("scoring", {})
+    matcher = keyword_matcher(
+        tuple(kw for tier, _ in KEYWORD_TIERS for kw in keywords.get(tier, [])) + tuple(learned_kw),
+        scoring.get("keyword_word_boundary", False),
+    )
+    found = matcher.find(f"{article.title} {article.summary}")
 
-    for kw in keywords.get("low_priority", []):
-        if kw.lower() in text:
-            score += 0.1
-            break
+    for tier, bonus in KEYWORD_TIERS:
+        if any(kw.lower() in found for kw in keywords.get(tier, [])):
+            score += bonus
 
     # Apply learned keyword boosts
-    if learned_weights:
-        learned_kw = learned_weights.get("keywords", {})
-        for kw, weight in learned_kw.items():
-            if kw.lower() in text:
-                # Learned keyword boost (scaled down)
-                score += (weight - 1.0) * 0.1
+    for kw, weight in learned_kw.items():
+        if kw.lower() in found:
+            # Learned keyword boost (scaled down)
+            score += (weight - 1.0) * 0.1
 
     # Reliability factor
-    scoring = config.get("scoring", {})
     reliability_weight = scoring.get("reliability_weight", 0.25)
     score += article.reliability * reliability_weight
 
@@ -122,31 +120,25 @@ def calculate_base_score(
     # >24h old gets no bonus
 
     # Content quality signals (from full article extraction)
-    if hasattr(article, 'full_text') and article.full_text:
-        # Article length bonus - substantive content
-        if len(article.full_text) > 500:
-            score += 0.1
-
-        # Has quotes or data - indicates real reporting
-        if '"' in article.full_text or "'" in article.full_text:
-            score += 0.05
-        if re.search(r'\d+(?:\.\d+)?\s*(?:percent|%|million|billion|thousand)', article.full_text, re.IGNORECASE):
-            score += 0.05
-    else:
-        # Extraction failed - possibly paywalled or low quality
-        if article.link and 'arxiv' not in article.link and 'reddit.com' not in article.link:
-            score -= 0.1
+    if include_full_text:
+        if hasattr(article, 'full_text') and article.full_text:
+            # Article length bonus - substantive content
+            if len(article.full_text) > 500:
+                score += 0.1
+
+            # Has quotes or data - indicates real reporting
+            if '"' in article.full_text or "'" in article.full_text:
+                score += 0.05
+            if DATA_POINTS.search(article.full_text):
+                score += 0.05
+        else:
+            # Extraction failed - possibly paywalled or low quality
+            if article.link and 'arxiv' not in article.link and 'reddit.com' not in article.link:
+                score -= 0.1
 
     # Clickbait penalty
-    title_upper = article.title.upper()
-    clickbait_patterns = [
-        r'\bYOU WON\'?T BELIEVE\b', r'\bSHOCKING\b', r'\bBREAKING\b.*!',
-        r'^\d+\s+(?:THINGS|WAYS|REASONS)\b', r'\bWHAT HAPPENS NEXT\b',
-    ]
-    for pattern in clickbait_patterns:
-        if re.search(pattern, title_upper):
-            score -= 0.15
-            break
+    if CLICKBAIT.search(article.title.upper()):
+        score -= 0.15
 
     return min(score, 2.0)  # Cap at 2.0
 
@@ -343,8 +335,11 @@ def curate_articles(
     decay_factor = learning_config.get("decay_factor", 0.95)
     decay_old_preferences(days=decay_days, decay_factor=decay_factor)
 
+    # Full text of articles that drop out below is released as they do
     print("Deduplicating articles...")
-    articles, related_pairs = deduplicate_articles(articles, similarity_threshold)
+    unique, related_pairs = deduplicate_articles(articles, similarity_threshold)
+    release_filtered(articles, unique)
+    articles = unique
     print(f"  {len(articles)} unique articles")
 
     # Store article relations from similarity analysis
@@ -356,21 +351,24 @@ def curate_articles(
 
     # Score all articles with learned weights
     print("Scoring articles...")
-    scored = []
-    for article in articles:
-        score = calculate_base_score(article, config, learned_weights)
-        if score >= min_score:
-            scored.append(CuratedArticle(article=article, score=score))
+    scores = BatchScorer(config, learned_weights).score(articles)
+    scored = [
+        CuratedArticle(article=article, score=float(score))
+        for article, score in zip(articles, scores)
+        if score >= min_score
+    ]
 
     scored.sort(key=lambda c: c.score, reverse=True)
+    release_filtered(articles, [c.article for c in scored])
     print(f"  {len(scored)} articles above threshold")
 
     # Exclude already-heard articles
     heard_hashes = get_heard_article_hashes(hours=12)
     if heard_hashes:
-        before = len(scored)
-        scored = [c for c in scored if c.article.article_hash not in heard_hashes]
-        excluded = before - len(scored)
+        unheard = [c for c in scored if c.article.article_hash not in heard_hashes]
+        release_filtered([c.article for c in scored], [c.article for c in unheard])
+        excluded = len(scored) - len(unheard)
+        scored = unheard
         if excluded > 0:
             print(f"  Excluded {excluded} already-heard articles")
 
@@ -424,6 +422,11 @@ def curate_articles(
 
         sections[name] = section_articles
 
+    release_filtered(
+        [c.article for c in scored],
+        [item.article for items in sections.values() for item in items],
+    )
+
     # Track articles shown (for learning engine)
     total_shown = 0
     for section_name, items in sections.items():
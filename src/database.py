@@ -4,14 +4,19 @@ Stores user preferences, engagement data, and source health.
 Database is isolated to this project in data/brief.db
 """
 
+import json
+import multiprocessing
+import os
 import sqlite3
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
-# Database path - isolated to this project
-DB_PATH = Path(__file__).parent.parent / "data" / "brief.db"
+from .source_health import breaker_after_failure
+
+# Database path - isolated to this project (NEWS_DB_PATH overrides it, e.g. for benchmarks)
+DB_PATH = Path(os.environ.get("NEWS_DB_PATH") or Path(__file__).parent.parent / "data" / "brief.db")
 
 
 def get_db_path() -> Path:
@@ -32,6 +37,71 @@ def get_connection():
         conn.close()
 
 
+def _ensure_columns(cursor, table: str, columns: dict[str, str]):
+    """Add columns missing from an existing table (lightweight migration)."""
+    cursor.execute(f"PRAGMA table_info({table})")
+    existing = {row[1] for row in cursor.fetchall()}
+    for name, col_type in columns.items():
+        if name not in existing:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {name} {col_type}")
+
+
+# Scheme of the stored article hashes (PRAGMA user_version); bump it when
+# generate_article_hash changes, so init_database rehashes stored articles
+ARTICLE_HASH_VERSION = 1
+
+
+def _rehash_articles(cursor):
+    """Move stored articles to the current generate_article_hash scheme.
+
+    Each article_cache/article_engagement row is rehashed from its title and
+    url, and clicks, feedback, relations and briefing segments follow, so
+    engagement and heard history carry over. Where variants of one story
+    now share a hash, the row already on it (or the first one) is kept.
+    """
+    cursor.execute("PRAGMA user_version")
+    if cursor.fetchone()[0] >= ARTICLE_HASH_VERSION:
+        return
+    from .feed_parser import generate_article_hash
+
+    rehash: dict[str, str] = {}
+    for table in ("article_cache", "article_engagement"):
+        cursor.execute(f"SELECT article_hash, title, url FROM {table}")
+        for old, title, url in cursor.fetchall():
+            new = generate_article_hash(title or "", url or "")
+            if new != old:
+                rehash.setdefault(old, new)
+
+    if rehash:
+        cursor.execute("CREATE TEMP TABLE rehash (old TEXT PRIMARY KEY, new TEXT NOT NULL)")
+        cursor.executemany("INSERT INTO rehash VALUES (?, ?)", rehash.items())
+        for table, column in (("article_cache", "article_hash"), ("article_engagement", "article_hash"),
+                              ("click_history", "article_hash"), ("feedback_log", "article_hash"),
+                              ("article_relations", "article_hash"), ("article_relations", "related_hash")):
+            cursor.execute(f"""
+                UPDATE OR IGNORE {table}
+                SET {column} = (SELECT new FROM rehash WHERE old = {column})
+                WHERE {column} IN (SELECT old FROM rehash)
+            """)
+            # Duplicates of a row kept under the new hash
+            cursor.execute(f"DELETE FROM {table} WHERE {column} IN (SELECT old FROM rehash)")
+        cursor.execute("DROP TABLE rehash")
+
+        cursor.execute("SELECT id, article_hashes FROM briefing_segments")
+        segments = []
+        for row in cursor.fetchall():
+            try:
+                hashes = json.loads(row["article_hashes"])
+            except (json.JSONDecodeError, TypeError):
+                continue
+            if any(h in rehash for h in hashes):
+                segments.append((json.dumps([rehash.get(h, h) for h in hashes]), row["id"]))
+        cursor.executemany("UPDATE briefing_segments SET article_hashes = ? WHERE id = ?", segments)
+        print(f"Rehashed {len(rehash)} stored articles (article hash scheme {ARTICLE_HASH_VERSION})")
+
+    cursor.execute(f"PRAGMA user_version = {ARTICLE_HASH_VERSION}")
+
+
 def init_database():
     """Initialize the database schema."""
     with get_connection() as conn:
@@ -108,6 +178,39 @@ def init_database():
             )
         """)
 
+        # Conditional GET validators (added after the table first shipped)
+        _ensure_columns(cursor, "source_health", {
+            "etag": "TEXT",
+            "last_modified": "TEXT",
+            "content_hash": "TEXT",
+            # Recent successful fetch latencies (JSON list, seconds)
+            "latency_samples": "TEXT",
+            "latency_p50": "REAL",
+            "latency_p95": "REAL",
+            # Circuit breaker ('closed' / 'open'; half-open once next_probe_at passes)
+            "breaker_state": "TEXT DEFAULT 'closed'",
+            "consecutive_failures": "INTEGER DEFAULT 0",
+            "next_probe_at": "TIMESTAMP",
+            "skipped_count": "INTEGER DEFAULT 0",
+            "time_saved_seconds": "REAL DEFAULT 0",
+            # Feed body size, and how often it hit max_feed_bytes
+            "last_feed_bytes": "INTEGER",
+            "truncated_count": "INTEGER DEFAULT 0",
+            # Fetch daemon polling schedule (seconds), learned from new entries
+            "poll_interval": "REAL",
+            "next_poll_at": "TIMESTAMP",
+            "last_new_entry_at": "TIMESTAMP",
+        })
+
+        # Last parsed entries per feed, reused on 304 / unchanged body
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS feed_snapshots (
+                source_name TEXT PRIMARY KEY,
+                articles TEXT,  -- JSON array of Article.to_dict()
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
         # Related articles cache (for context linking)
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS article_relations (
@@ -138,6 +241,64 @@ def init_database():
             )
         """)
 
+        # Fetch-time fields so later runs can skip re-cleaning/re-extracting
+        _ensure_columns(cursor, "article_cache", {
+            "full_text": "TEXT",
+            "language": "TEXT",
+            "reliability": "REAL",
+        })
+
+        # Full-text extraction cache, keyed by canonical URL
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS extraction_cache (
+                url TEXT PRIMARY KEY,
+                text TEXT,
+                extractor TEXT,  -- 'trafilatura', 'newspaper', 'readability', 'html'
+                failure_reason TEXT,  -- NULL on success
+                fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        _ensure_columns(cursor, "extraction_cache", {
+            # Downloaded page size, and whether it hit max_page_bytes
+            "page_bytes": "INTEGER",
+            "truncated": "INTEGER DEFAULT 0",
+            # Feed the article came from, for per-source success rates
+            "source": "TEXT",
+        })
+
+        # Full-text extractor outcomes per domain, ordering the extractor registry
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS extractor_stats (
+                domain TEXT NOT NULL,
+                extractor TEXT NOT NULL,
+                attempts INTEGER DEFAULT 0,
+                successes INTEGER DEFAULT 0,
+                total_seconds REAL DEFAULT 0,
+                updated_at TIMESTAMP,
+                PRIMARY KEY (domain, extractor)
+            )
+        """)
+
+        # Per-request fetch timings, one row per feed/article URL per run
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS fetch_telemetry (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_id TEXT NOT NULL,
+                url TEXT NOT NULL,
+                kind TEXT,  -- 'feed' or 'page'
+                source TEXT,
+                status INTEGER,
+                bytes INTEGER,
+                error TEXT,
+                queue REAL, dns REAL, connect REAL, ttfb REAL,
+                body REAL, parse REAL, extract REAL, total REAL,
+                recorded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_fetch_telemetry_run ON fetch_telemetry(run_id)
+        """)
+
         # Briefing segments - track what user has heard
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS briefing_segments (
@@ -179,6 +340,8 @@ def init_database():
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_article_cache_date ON article_cache(fetched_at)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_briefing_segments_id ON briefing_segments(briefing_id)")
 
+        _rehash_articles(cursor)
+
         print(f"Database initialized at {get_db_path()}")
 
 
@@ -314,28 +477,188 @@ def decay_old_preferences(days: int = 30, decay_factor: float = 0.95):
         """, (decay_factor, datetime.now(), cutoff))
 
 
-def record_source_health(source_name: str, url: str, success: bool, article_count: int = 0):
-    """Record source fetch health for monitoring."""
+# Successful fetch latencies kept per source for percentile estimates
+LATENCY_WINDOW = 20
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, round(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _apply_health_event(row: dict, event: dict):
+    """Fold one fetch outcome into a source_health row (in memory)."""
+    row["url"] = event["url"]
+    at = event["at"]
+
+    if event["success"]:
+        count = event.get("article_count", 0)
+        row["last_success"] = at
+        row["avg_articles"] = count if row["_new"] else (row["avg_articles"] + count) // 2
+        row["success_count"] += 1
+        row["consecutive_failures"] = 0
+        row["breaker_state"] = "closed"
+        row["next_probe_at"] = None
+        if event.get("bytes") is not None:
+            row["last_feed_bytes"] = event["bytes"]
+        if event.get("truncated"):
+            row["truncated_count"] += 1
+
+        # Only successful latencies count, so a broken feed's timeouts
+        # don't inflate its percentiles
+        latency = event.get("latency")
+        if latency is not None:
+            try:
+                samples = json.loads(row["latency_samples"] or "[]")
+            except (json.JSONDecodeError, TypeError):
+                samples = []
+            samples = (samples + [round(latency, 3)])[-LATENCY_WINDOW:]
+            row["latency_samples"] = json.dumps(samples)
+            row["latency_p50"] = _percentile(samples, 50)
+            row["latency_p95"] = _percentile(samples, 95)
+    else:
+        row["last_failure"] = at
+        row["failure_count"] += 1
+        row["consecutive_failures"] += 1
+        row["breaker_state"], row["next_probe_at"] = breaker_after_failure(
+            row["consecutive_failures"], now=at,
+        )
+
+    row["_new"] = False
+
+
+def write_fetch_health(events: list[dict], skips: list[tuple[str, float]] = (),
+                       snapshots: list[dict] = (), polls: list[dict] = ()):
+    """Write a fetch run's source health in a single transaction.
+
+    events: {source_name, url, success, at, article_count?, latency?, bytes?,
+    truncated?}, in order.
+    skips: (source_name, seconds_saved) for circuit-open skips.
+    snapshots: {source_name, url, articles, etag, last_modified, content_hash}.
+    polls: {source_name, url, poll_interval, next_poll_at, last_new_entry_at?}
+    from the fetch daemon; last_new_entry_at is kept when None.
+    """
+    if not events and not skips and not snapshots and not polls:
+        return
+
     with get_connection() as conn:
         cursor = conn.cursor()
 
-        if success:
-            cursor.execute("""
-                INSERT INTO source_health (source_name, url, last_success, success_count, avg_articles)
-                VALUES (?, ?, ?, 1, ?)
-                ON CONFLICT(source_name) DO UPDATE SET
-                    last_success = ?,
-                    success_count = success_count + 1,
-                    avg_articles = (avg_articles + ?) / 2
-            """, (source_name, url, datetime.now(), article_count, datetime.now(), article_count))
-        else:
-            cursor.execute("""
-                INSERT INTO source_health (source_name, url, last_failure, failure_count)
-                VALUES (?, ?, ?, 1)
-                ON CONFLICT(source_name) DO UPDATE SET
-                    last_failure = ?,
-                    failure_count = failure_count + 1
-            """, (source_name, url, datetime.now(), datetime.now()))
+        names = sorted({e["source_name"] for e in events})
+        rows = {}
+        for i in range(0, len(names), 500):
+            chunk = names[i:i + 500]
+            placeholders = ",".join("?" for _ in chunk)
+            cursor.execute(
+                f"SELECT * FROM source_health WHERE source_name IN ({placeholders})", chunk,
+            )
+            for row in cursor.fetchall():
+                rows[row["source_name"]] = dict(row, _new=False)
+
+        for event in events:
+            row = rows.setdefault(event["source_name"], {
+                "source_name": event["source_name"], "_new": True,
+                "last_success": None, "last_failure": None,
+                "success_count": 0, "failure_count": 0, "avg_articles": 0,
+                "latency_samples": None, "latency_p50": None, "latency_p95": None,
+                "breaker_state": "closed", "consecutive_failures": 0, "next_probe_at": None,
+                "last_feed_bytes": None, "truncated_count": 0,
+            })
+            for key in ("success_count", "failure_count", "avg_articles", "consecutive_failures",
+                        "truncated_count"):
+                row[key] = row[key] or 0
+            _apply_health_event(row, event)
+
+        cursor.executemany("""
+            INSERT INTO source_health
+            (source_name, url, last_success, last_failure, success_count, failure_count,
+             avg_articles, latency_samples, latency_p50, latency_p95,
+             breaker_state, consecutive_failures, next_probe_at,
+             last_feed_bytes, truncated_count)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(source_name) DO UPDATE SET
+                url = excluded.url,
+                last_success = excluded.last_success,
+                last_failure = excluded.last_failure,
+                success_count = excluded.success_count,
+                failure_count = excluded.failure_count,
+                avg_articles = excluded.avg_articles,
+                latency_samples = excluded.latency_samples,
+                latency_p50 = excluded.latency_p50,
+                latency_p95 = excluded.latency_p95,
+                breaker_state = excluded.breaker_state,
+                consecutive_failures = excluded.consecutive_failures,
+                next_probe_at = excluded.next_probe_at,
+                last_feed_bytes = excluded.last_feed_bytes,
+                truncated_count = excluded.truncated_count
+        """, [
+            (r["source_name"], r["url"], r["last_success"], r["last_failure"],
+             r["success_count"], r["failure_count"], r["avg_articles"],
+             r["latency_samples"], r["latency_p50"], r["latency_p95"],
+             r["breaker_state"], r["consecutive_failures"], r["next_probe_at"],
+             r["last_feed_bytes"], r["truncated_count"])
+            for r in rows.values()
+        ])
+
+        cursor.executemany("""
+            UPDATE source_health
+            SET skipped_count = skipped_count + 1,
+                time_saved_seconds = time_saved_seconds + ?
+            WHERE source_name = ?
+        """, [(seconds, name) for name, seconds in skips])
+
+        cursor.executemany("""
+            INSERT INTO source_health (source_name, url, etag, last_modified, content_hash)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(source_name) DO UPDATE SET
+                etag = excluded.etag,
+                last_modified = excluded.last_modified,
+                content_hash = excluded.content_hash
+        """, [
+            (snap["source_name"], snap["url"], snap.get("etag"),
+             snap.get("last_modified"), snap.get("content_hash"))
+            for snap in snapshots
+        ])
+        now = datetime.now()
+        cursor.executemany(
+            "INSERT OR REPLACE INTO feed_snapshots (source_name, articles, updated_at) VALUES (?, ?, ?)",
+            [(snap["source_name"], json.dumps(snap["articles"]), now) for snap in snapshots],
+        )
+
+        cursor.executemany("""
+            INSERT INTO source_health
+            (source_name, url, poll_interval, next_poll_at, last_new_entry_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(source_name) DO UPDATE SET
+                poll_interval = excluded.poll_interval,
+                next_poll_at = excluded.next_poll_at,
+                last_new_entry_at = COALESCE(excluded.last_new_entry_at,
+                                             source_health.last_new_entry_at)
+        """, [
+            (poll["source_name"], poll["url"], poll["poll_interval"],
+             poll["next_poll_at"], poll.get("last_new_entry_at"))
+            for poll in polls
+        ])
+
+
+def record_source_health(source_name: str, url: str, success: bool, article_count: int = 0,
+                         latency: float | None = None):
+    """Record source fetch health for monitoring.
+
+    latency (seconds) is only recorded for successful fetches. Also drives
+    the circuit breaker: a success closes it, repeated failures open it
+    with backoff. Batch callers should use write_fetch_health directly.
+    """
+    write_fetch_health([{
+        "source_name": source_name,
+        "url": url,
+        "success": success,
+        "article_count": article_count,
+        "latency": latency,
+        "at": datetime.now(),
+    }])
 
 
 def get_unhealthy_sources(failure_threshold: int = 5) -> list[str]:
@@ -352,6 +675,35 @@ def get_unhealthy_sources(failure_threshold: int = 5) -> list[str]:
         return [row['source_name'] for row in cursor.fetchall()]
 
 
+def get_source_states(source_names: list[str] | None = None) -> dict[str, dict]:
+    """Get the stored health row for every source (or just source_names), keyed by source name."""
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        if source_names is None:
+            cursor.execute("SELECT * FROM source_health")
+        else:
+            placeholders = ", ".join("?" for _ in source_names)
+            cursor.execute(
+                f"SELECT * FROM source_health WHERE source_name IN ({placeholders})",
+                list(source_names),
+            )
+        return {row['source_name']: dict(row) for row in cursor.fetchall()}
+
+
+def get_feed_snapshots() -> dict[str, list[dict]]:
+    """Get the last parsed entries of every feed, keyed by source name."""
+    snapshots = {}
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT source_name, articles FROM feed_snapshots")
+        for row in cursor.fetchall():
+            try:
+                snapshots[row["source_name"]] = json.loads(row["articles"])
+            except (json.JSONDecodeError, TypeError):
+                continue
+    return snapshots
+
+
 def cache_article(article_hash: str, title: str, summary: str, ai_summary: str,
                   source: str, category: str, url: str, published_at: datetime,
                   keywords: list[str] = None):
@@ -361,12 +713,76 @@ def cache_article(article_hash: str, title: str, summary: str, ai_summary: str,
     with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("""
-            INSERT OR REPLACE INTO article_cache
+            INSERT INTO article_cache
             (article_hash, title, summary, ai_summary, source, category, url, published_at, keywords)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(article_hash) DO UPDATE SET
+                title = excluded.title,
+                summary = excluded.summary,
+                ai_summary = excluded.ai_summary,
+                source = excluded.source,
+                category = excluded.category,
+                url = excluded.url,
+                published_at = excluded.published_at,
+                keywords = excluded.keywords
         """, (article_hash, title, summary, ai_summary, source, category, url, published_at, keywords_json))
 
 
+def store_fetched_articles(articles: list[dict]):
+    """Upsert freshly fetched articles into the cache in one transaction.
+
+    Keeps the first fetched_at and any ai_summary/keywords from curation,
+    and never overwrites stored full_text with an empty extraction.
+    """
+    now = datetime.now()
+    rows = [
+        (a["article_hash"], a["title"], a["summary"], a["source"], a["category"],
+         a["link"], a["published"], now, a.get("full_text", ""), a["language"], a["reliability"])
+        for a in articles
+    ]
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.executemany("""
+            INSERT INTO article_cache
+            (article_hash, title, summary, source, category, url, published_at,
+             fetched_at, full_text, language, reliability)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(article_hash) DO UPDATE SET
+                summary = excluded.summary,
+                full_text = COALESCE(NULLIF(excluded.full_text, ''), article_cache.full_text),
+                language = excluded.language,
+                reliability = excluded.reliability
+        """, rows)
+
+
+def get_recent_articles(hours: int = 24) -> list[dict]:
+    """Get articles fetched in the last N hours, newest first, as stored."""
+    cutoff = datetime.now() - timedelta(hours=hours)
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT article_hash, title, url, summary, source, category, published_at,
+                   full_text, language, reliability
+            FROM article_cache
+            WHERE fetched_at > ?
+            ORDER BY published_at DESC
+        """, (cutoff,))
+        return [dict(row) for row in cursor.fetchall()]
+
+
+def get_known_articles(days_back: int = 2) -> dict[str, dict]:
+    """Get recently fetched articles keyed by hash, for incremental ingestion."""
+    cutoff = datetime.now() - timedelta(days=days_back)
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT article_hash, source, summary, full_text, fetched_at
+            FROM article_cache
+            WHERE fetched_at > ?
+        """, (cutoff,))
+        return {row['article_hash']: dict(row) for row in cursor.fetchall()}
+
+
 def find_related_cached_articles(keywords: list[str], category: str,
                                   days_back: int = 7, limit: int = 5) -> list[dict]:
     """Find related articles from cache for context linking."""
@@ -376,12 +792,15 @@ def find_related_cached_articles(keywords: list[str], category: str,
         cursor = conn.cursor()
 
         # Simple keyword matching - could be enhanced with embeddings later
-        keyword_conditions = " OR ".join(["keywords LIKE ?" for _ in keywords])
+        conditions = ["category = ?"] + ["keywords LIKE ?" for _ in keywords]
         keyword_params = [f"%{kw}%" for kw in keywords]
 
+        # Not SELECT *: cached rows also carry the full article text
         cursor.execute(f"""
-            SELECT * FROM article_cache
-            WHERE (category = ? OR {keyword_conditions})
+            SELECT article_hash, title, summary, ai_summary, source, category,
+                   url, published_at, fetched_at, keywords
+            FROM article_cache
+            WHERE ({" OR ".join(conditions)})
             AND fetched_at > ?
             ORDER BY fetched_at DESC
             LIMIT ?
@@ -444,7 +863,6 @@ def get_engagement_stats() -> dict:
 
 def record_briefing_segments(briefing_id: str, segments: list[dict]):
     """Record briefing segments after TTS generation."""
-    import json
     with get_connection() as conn:
         cursor = conn.cursor()
         for seg in segments:
@@ -462,7 +880,6 @@ def record_briefing_segments(briefing_id: str, segments: list[dict]):
 
 def mark_segments_heard(heard_hashes: list[str]):
     """Mark segments as heard based on article hashes from the client."""
-    import json
     if not heard_hashes:
         return
 
@@ -487,7 +904,6 @@ def mark_segments_heard(heard_hashes: list[str]):
 
 def get_heard_article_hashes(hours: int = 12) -> set[str]:
     """Get article hashes from segments marked as heard within the last N hours."""
-    import json
     cutoff = datetime.now() - timedelta(hours=hours)
     heard = set()
 
@@ -509,7 +925,6 @@ def get_heard_article_hashes(hours: int = 12) -> set[str]:
 
 def get_research_cache(query: str, ttl_hours: int = 12) -> list[dict] | None:
     """Get cached research results if fresh enough."""
-    import json
     cutoff = datetime.now() - timedelta(hours=ttl_hours)
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -528,7 +943,6 @@ def get_research_cache(query: str, ttl_hours: int = 12) -> list[dict] | None:
 
 def set_research_cache(query: str, results: list[dict]):
     """Store research results in cache."""
-    import json
     with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
@@ -537,9 +951,155 @@ def set_research_cache(query: str, results: list[dict]):
         )
 
 
+def get_cached_extractions(urls: list[str], ttl_hours: int = 72,
+                           failure_ttl_hours: int = 6) -> dict[str, dict]:
+    """Get fresh extraction results for canonical URLs.
+
+    Successful extractions are reused for ttl_hours; failures are
+    remembered for failure_ttl_hours so dead pages are not retried.
+    """
+    if not urls:
+        return {}
+    now = datetime.now()
+    ok_cutoff = now - timedelta(hours=ttl_hours)
+    fail_cutoff = now - timedelta(hours=failure_ttl_hours)
+    results = {}
+
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        # Chunk to stay under SQLite's bound-parameter limit
+        for i in range(0, len(urls), 500):
+            chunk = urls[i:i + 500]
+            placeholders = ",".join("?" for _ in chunk)
+            cursor.execute(f"""
+                SELECT * FROM extraction_cache
+                WHERE url IN ({placeholders})
+                AND ((failure_reason IS NULL AND fetched_at > ?)
+                     OR (failure_reason IS NOT NULL AND fetched_at > ?))
+            """, chunk + [ok_cutoff, fail_cutoff])
+            for row in cursor.fetchall():
+                results[row["url"]] = dict(row)
+
+    return results
+
+
+def get_cached_extraction(url: str, ttl_hours: int = 72,
+                          failure_ttl_hours: int = 6) -> dict | None:
+    """Get a fresh extraction result for one canonical URL."""
+    return get_cached_extractions([url], ttl_hours, failure_ttl_hours).get(url)
+
+
+def store_extractions(results: list[dict]):
+    """Store extraction results (url, text, extractor, failure_reason,
+    page_bytes?, truncated?, source?)."""
+    if not results:
+        return
+    now = datetime.now()
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.executemany("""
+            INSERT OR REPLACE INTO extraction_cache
+            (url, text, extractor, failure_reason, fetched_at, page_bytes, truncated, source)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (r["url"], r.get("text"), r.get("extractor"), r.get("failure_reason"), now,
+             r.get("page_bytes"), int(bool(r.get("truncated"))), r.get("source"))
+            for r in results
+        ])
+
+
+def get_extraction_success_rates(days: int = 14) -> dict[str, tuple[int, int]]:
+    """Per-source (attempts, successes) of page extractions in the last N days."""
+    cutoff = datetime.now() - timedelta(days=days)
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT source, COUNT(*) AS attempts,
+                   SUM(CASE WHEN failure_reason IS NULL THEN 1 ELSE 0 END) AS successes
+            FROM extraction_cache
+            WHERE source IS NOT NULL AND fetched_at > ?
+            GROUP BY source
+        """, (cutoff,))
+        return {row["source"]: (row["attempts"], row["successes"]) for row in cursor.fetchall()}
+
+
+def get_source_yields(days: int = 14) -> dict[str, tuple[int, int]]:
+    """Per-source (fetched, shown) article counts for the last N days.
+
+    Shown means the article made it into a brief section.
+    """
+    cutoff = datetime.now() - timedelta(days=days)
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT c.source, COUNT(*) AS fetched, COUNT(e.article_hash) AS shown
+            FROM article_cache c
+            LEFT JOIN article_engagement e ON e.article_hash = c.article_hash
+            WHERE c.source IS NOT NULL AND c.fetched_at > ?
+            GROUP BY c.source
+        """, (cutoff,))
+        return {row["source"]: (row["fetched"], row["shown"]) for row in cursor.fetchall()}
+
+
+def get_extractor_stats() -> dict[tuple[str, str], dict]:
+    """Extractor outcomes keyed by (domain, extractor)."""
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT * FROM extractor_stats")
+        return {(row["domain"], row["extractor"]): dict(row) for row in cursor.fetchall()}
+
+
+def record_extractor_outcomes(outcomes: list[tuple[str, str, bool, float]]):
+    """Add (domain, extractor, success, seconds) outcomes to extractor_stats."""
+    if not outcomes:
+        return
+    now = datetime.now()
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.executemany("""
+            INSERT INTO extractor_stats (domain, extractor, attempts, successes, total_seconds, updated_at)
+            VALUES (?, ?, 1, ?, ?, ?)
+            ON CONFLICT(domain, extractor) DO UPDATE SET
+                attempts = attempts + 1,
+                successes = successes + excluded.successes,
+                total_seconds = total_seconds + excluded.total_seconds,
+                updated_at = excluded.updated_at
+        """, [(domain, extractor, int(success), seconds, now)
+              for domain, extractor, success, seconds in outcomes])
+
+
+def store_fetch_telemetry(run_id: str, rows: list[dict]):
+    """Store a fetch run's per-request timings (see telemetry.FetchTelemetry.rows)."""
+    if not rows:
+        return
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.executemany("""
+            INSERT INTO fetch_telemetry
+            (run_id, url, kind, source, status, bytes, error,
+             queue, dns, connect, ttfb, body, parse, extract, total)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (run_id, r["url"], r.get("kind"), r.get("source"), r.get("status"),
+             r.get("bytes"), r.get("error"), r["queue"], r["dns"], r["connect"],
+             r["ttfb"], r["body"], r["parse"], r["extract"], r["total"])
+            for r in rows
+        ])
+
+
+def store_extraction(url: str, text: str | None, extractor: str | None,
+                     failure_reason: str | None = None):
+    """Store a single extraction result."""
+    store_extractions([{
+        "url": url,
+        "text": text,
+        "extractor": extractor,
+        "failure_reason": failure_reason,
+    }])
+
+
 def record_deep_dive(topic: str, category: str, queries: list[str]):
     """Record a deep dive generation."""
-    import json
     with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
@@ -548,8 +1108,12 @@ def record_deep_dive(topic: str, category: str, queries: list[str]):
         )
 
 
-# Initialize on import
-init_database()
+# Initialize on import, in the main process only: process pool workers
+# (see workers.py) re-import the entry module, and never use the database.
+# (Checked by name: a spawned worker is named before it imports the entry
+# module, but only learns its parent_process() after.)
+if multiprocessing.current_process().name == "MainProcess":
+    init_database()
 
 
 if __name__ == "__main__":
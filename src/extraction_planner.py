@@ -0,0 +1,117 @@
+"""Choose which articles get full-text extraction.
+
+Instead of the newest N articles, extraction goes to the candidates that
+could actually make a daily_brief section: each section's category is
+ranked by a pre-extraction score and only its top quota (with headroom)
+is extracted. The fetch pipeline plans each category as its feeds finish.
+"""
+
+import math
+
+from .batch_scorer import BatchScorer
+
+
+def unextractable_sources(
+    rates: dict[str, tuple[int, int]],
+    min_success_rate: float = 0.05,
+    min_attempts: int = 10,
+) -> set[str]:
+    """Sources whose recent pages (nearly) never extract."""
+    return {
+        source
+        for source, (attempts, successes) in rates.items()
+        if attempts >= min_attempts and successes / attempts < min_success_rate
+    }
+
+
+class PreScorer:
+    """calculate_base_score without full-text signals, config and weights loaded once."""
+
+    # Best case the full-text signals could still add
+    FULL_TEXT_HEADROOM = 0.2
+
+    def __init__(self, curation_config_path: str = "config/curation.yaml"):
+        # Imported here: curator imports fetcher, which runs the planner
+        from .curator import calculate_base_score, load_curation_config
+        from .database import get_learned_weights
+
+        self._score = calculate_base_score
+        self.config = load_curation_config(curation_config_path)
+        self.learned_weights = get_learned_weights()
+        self.batch = BatchScorer(self.config, self.learned_weights)
+        self.min_score = self.config.get("scoring", {}).get("min_score", 0.25)
+
+    def __call__(self, article) -> float:
+        return self._score(article, self.config, self.learned_weights, include_full_text=False)
+
+    def score_all(self, articles: list) -> dict[str, float]:
+        """Pre-scores by article hash."""
+        scores = self.batch.score(articles, include_full_text=False)
+        return {article.article_hash: float(score) for article, score in zip(articles, scores)}
+
+    def could_qualify(self, score: float) -> bool:
+        """Whether full text could lift this pre-score to min_score."""
+        return score + self.FULL_TEXT_HEADROOM >= self.min_score
+
+
+def plan_extraction(
+    articles: list,
+    curation_config_path: str = "config/curation.yaml",
+    max_articles: int = 80,
+    oversample: float = 1.5,
+    skip_sources: set[str] | None = None,
+    scorer: PreScorer | None = None,
+    scores: dict[str, float] | None = None,
+) -> list:
+    """
+    Articles worth extracting, best pre-score first, at most max_articles.
+
+    Each section takes its category's top count x oversample articles by
+    calculate_base_score without full-text signals. The same per-source cap
+    as curation applies, also scaled by oversample. Articles that already
+    have full text (carried forward, or full content in the feed) and
+    articles from skip_sources are not planned.
+
+    Pre-scores already computed (by article hash, e.g. at ingest) can be
+    passed as scores; the rest are scored here.
+    """
+    scorer = scorer or PreScorer(curation_config_path)
+    scores = scores or {}
+    skip_sources = skip_sources or set()
+
+    scored = []
+    for article in articles:
+        score = scores.get(article.article_hash)
+        if score is None:
+            score = scorer(article)
+        if scorer.could_qualify(score):
+            scored.append((score, article))
+    scored.sort(key=lambda s: s[0], reverse=True)
+
+    taken_ids = set()
+    planned = []
+    for section in scorer.config.get("daily_brief", {}).get("sections", []):
+        category = section.get("category")
+        quota = math.ceil(section.get("count", 5) * oversample)
+        per_source = math.ceil(3 * oversample)
+        source_counts = {}
+        taken = 0
+
+        for score, article in scored:
+            if taken >= quota:
+                break
+            if category and article.category != category:
+                continue
+            if id(article) in taken_ids:
+                continue
+            if source_counts.get(article.source, 0) >= per_source:
+                continue
+            source_counts[article.source] = source_counts.get(article.source, 0) + 1
+            taken += 1
+            taken_ids.add(id(article))
+            if article.full_text or article.source in skip_sources:
+                continue
+            planned.append((score, article))
+
+    ranked = sorted(planned, key=lambda s: s[0], reverse=True)
+    return [article for _, article in ranked[:max_articles]]
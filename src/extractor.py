@@ -0,0 +1,59 @@
+"""Full-text extraction from already-downloaded article HTML.
+
+These functions run inside worker processes (see workers.py), so they take
+and return plain values and import their parsers lazily.
+"""
+
+from typing import Optional
+
+MIN_TEXT_LENGTH = 100
+
+
+def _trafilatura(url: str, html: str) -> Optional[str]:
+    import trafilatura
+    return trafilatura.extract(
+        html,
+        include_comments=False,
+        include_tables=False,
+        no_fallback=True,
+    )
+
+
+def _newspaper(url: str, html: str) -> Optional[str]:
+    from newspaper import Article as NewsArticle
+    news_article = NewsArticle(url)
+    news_article.download(input_html=html)  # No second download
+    news_article.parse()
+    return news_article.text
+
+
+EXTRACTORS = {
+    "trafilatura": _trafilatura,
+    "newspaper": _newspaper,
+}
+
+
+def extract_text(
+    url: str,
+    html: str,
+    methods: tuple[str, ...] = ("trafilatura", "newspaper"),
+) -> tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Extract article text from HTML, trying each of methods in order.
+
+    Returns (text, extractor, failure_reason); text is None on failure.
+    """
+    failure = "no_content"
+
+    for method in methods:
+        try:
+            text = EXTRACTORS[method](url, html)
+        except ImportError:
+            continue
+        except Exception as e:
+            failure = f"{method}: {type(e).__name__}"
+            continue
+        if text and len(text) > MIN_TEXT_LENGTH:
+            return text, method, None
+
+    return None, None, failure
@@ -0,0 +1,131 @@
+"""Per-domain choice of full-text extractors.
+
+Rules map a domain (and optionally a URL path pattern) to the extractors
+worth trying, in order:
+
+    rss_content     the feed entry's own text, no download
+    arxiv_abstract  the abstract arXiv puts in its feed entries, no download
+    trafilatura     page download, then trafilatura
+    newspaper       page download, then newspaper
+    skip            stop: don't extract at all
+
+Recorded per-domain success and latency reorder a domain's extractors
+once there are enough attempts, so the one that works there runs first.
+"""
+
+import re
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+RSS_CONTENT = "rss_content"
+ARXIV_ABSTRACT = "arxiv_abstract"
+TRAFILATURA = "trafilatura"
+NEWSPAPER = "newspaper"
+SKIP = "skip"
+
+# Extractors that work from the feed entry and never touch the network
+ZERO_NETWORK = {RSS_CONTENT, ARXIV_ABSTRACT}
+PAGE_EXTRACTORS = {TRAFILATURA, NEWSPAPER}
+
+DEFAULT_CHAIN = (TRAFILATURA, NEWSPAPER)
+
+# arXiv entries read "arXiv:2410.01234v1 Announce Type: new Abstract: ..."
+_ARXIV_PREAMBLE = re.compile(r"^.*?\bAbstract:\s*", re.DOTALL)
+
+
+@dataclass
+class ExtractorRule:
+    """Extractors for URLs on domain (and its subdomains) whose path matches."""
+    domain: str
+    extractors: tuple[str, ...]
+    path: str | None = None  # regex searched in the URL path
+    min_length: int = 100    # zero-network text shorter than this doesn't count
+
+    def matches(self, host: str, path: str) -> bool:
+        if host != self.domain and not host.endswith("." + self.domain):
+            return False
+        return self.path is None or re.search(self.path, path) is not None
+
+
+DEFAULT_RULES = [
+    # trafilatura can't extract reddit; the feed has the post body
+    ExtractorRule("reddit.com", (RSS_CONTENT,)),
+    # Trending repos: the feed has description + stats; trending pages themselves are fetched
+    ExtractorRule("github.com", (RSS_CONTENT,), path=r"^/(?!trending)", min_length=50),
+    ExtractorRule("arxiv.org", (ARXIV_ABSTRACT,)),
+]
+
+
+def _domain(url: str) -> str:
+    host = (urlsplit(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def zero_network_text(extractor: str, summary: str) -> str:
+    """Text a zero-network extractor gets from the feed entry's summary."""
+    if extractor == ARXIV_ABSTRACT:
+        return _ARXIV_PREAMBLE.sub("", summary, count=1).strip()
+    return summary.strip()
+
+
+class ExtractorRegistry:
+    """Rules plus per-domain stats, deciding the extractor order for a URL."""
+
+    def __init__(self, rules: list[ExtractorRule] | None = None,
+                 stats: dict[tuple[str, str], dict] | None = None,
+                 min_attempts: int = 5):
+        self.rules = list(rules if rules is not None else DEFAULT_RULES)
+        self.stats = stats or {}
+        self.min_attempts = min_attempts
+
+    @classmethod
+    def from_config(cls, rule_configs: list[dict] | None,
+                    stats: dict[tuple[str, str], dict] | None = None) -> "ExtractorRegistry":
+        """Configured rules (fetch.extraction_rules) take precedence over the defaults."""
+        rules = [
+            ExtractorRule(
+                domain=r["domain"].lower(),
+                extractors=tuple(r["extractors"]),
+                path=r.get("path"),
+                min_length=r.get("min_length", 100),
+            )
+            for r in rule_configs or []
+        ]
+        return cls(rules + DEFAULT_RULES, stats)
+
+    @staticmethod
+    def domain(url: str) -> str:
+        """Domain stats are kept under (www. stripped)."""
+        return _domain(url)
+
+    def rule_for(self, url: str) -> ExtractorRule | None:
+        parts = urlsplit(url)
+        host = _domain(url)
+        for rule in self.rules:
+            if rule.matches(host, parts.path or "/"):
+                return rule
+        return None
+
+    def _rank(self, domain: str, extractor: str) -> tuple[float, float]:
+        """Sort key: smoothed success rate (desc), then mean latency (asc).
+
+        Extractors with fewer than min_attempts on record rank as a coin
+        flip, so with no stats the rule's own order stands.
+        """
+        s = self.stats.get((domain, extractor))
+        if not s or s["attempts"] < self.min_attempts:
+            return (-0.5, float("inf"))
+        rate = (s["successes"] + 1) / (s["attempts"] + 2)
+        return (-rate, s["total_seconds"] / s["attempts"])
+
+    def order_for(self, url: str) -> tuple[list[str], int]:
+        """(extractors to try in order, min_length for zero-network text)."""
+        rule = self.rule_for(url)
+        chain = list(rule.extractors) if rule else list(DEFAULT_CHAIN)
+        min_length = rule.min_length if rule else 100
+        if SKIP in chain:
+            chain = chain[:chain.index(SKIP)]
+
+        domain = _domain(url)
+        chain.sort(key=lambda e: self._rank(domain, e))
+        return chain, min_length
@@ -0,0 +1,88 @@
+"""Feed document parsing, run in worker processes (see workers.py).
+
+Takes the raw response bytes and returns compact per-entry tuples, so the
+event loop neither parses XML nor unpickles feedparser's entry objects.
+"""
+
+import calendar
+import hashlib
+
+import feedparser
+
+from .utils.html_text import html_to_text
+from .utils.urls import canonicalize_url
+
+# (title, link, article_hash, summary, published, full_text); summary is
+# None for entries whose hash was passed in skip_hashes (already ingested).
+# published is a UTC epoch timestamp when feedparser could parse the date,
+# else the raw date string, else None. full_text is the entry's own content
+# when it is at least full_text_min characters, else "".
+EntryTuple = tuple[str, str, str, str | None, float | str | None, str]
+
+# Cap on full text kept per article, as for extracted pages
+FULL_TEXT_LIMIT = 3000
+
+
+def generate_article_hash(title: str, link: str) -> str:
+    """Generate a unique hash for an article.
+
+    Uses the canonical link and case/whitespace-folded title, so tracking
+    parameters and AMP/mobile variants of one story hash the same. Stored
+    hashes follow a change here only if database.ARTICLE_HASH_VERSION is bumped.
+    """
+    title = " ".join(title.lower().split())
+    content = f"{title}:{canonicalize_url(link)}".encode('utf-8')
+    return hashlib.md5(content).hexdigest()[:16]
+
+
+def _entry_date(entry) -> float | str | None:
+    """feedparser's pre-parsed date if available, else the raw string."""
+    for date_field in ["published", "updated", "created"]:
+        if hasattr(entry, date_field):
+            parsed = entry.get(f"{date_field}_parsed")
+            if parsed:
+                return float(calendar.timegm(parsed))
+            return getattr(entry, date_field)
+    return None
+
+
+def parse_feed(
+    content: bytes,
+    content_type: str = "",
+    max_entries: int = 20,
+    skip_hashes: frozenset[str] = frozenset(),
+    full_text_min: int = 1000,
+) -> list[EntryTuple]:
+    """Parse a feed document into entry tuples, newest-first as published."""
+    feed = feedparser.parse(content, response_headers={"content-type": content_type})
+    entries = []
+
+    for entry in feed.entries[:max_entries]:
+        title = entry.get("title", "No title")
+        link = entry.get("link", "")
+        article_hash = generate_article_hash(title, link)
+
+        pub_date = _entry_date(entry)
+
+        # Already ingested on an earlier run: the caller reuses stored text
+        if article_hash in skip_hashes:
+            entries.append((title, link, article_hash, None, pub_date, ""))
+            continue
+
+        # Extract summary, preferring content over summary
+        summary = ""
+        if hasattr(entry, "content") and entry.content:
+            summary = entry.content[0].get("value", "")
+        elif hasattr(entry, "summary"):
+            summary = entry.summary or ""
+        elif hasattr(entry, "description"):
+            summary = entry.description or ""
+
+        # Clean HTML once; feeds that carry the whole article need no extraction
+        text = html_to_text(summary, limit=FULL_TEXT_LIMIT)
+        full_text = text.strip() if len(text.strip()) >= full_text_min else ""
+        summary = text[:500].strip()
+
+        entries.append((title, link, article_hash, summary, pub_date, full_text))
+
+    return entries
@@ -0,0 +1,213 @@
+"""Long-running fetcher that polls each feed on its own learned interval.
+
+New articles are extracted and stored as they appear, so a brief can run
+against the warm article store (python -m src.main --from-store) instead
+of crawling every feed first.
+
+Usage: python -m src.fetch_daemon [--feeds-config config/feeds.yaml] [--once]
+"""
+
+import argparse
+import asyncio
+from datetime import datetime
+
+import aiohttp
+
+from .database import (
+    get_source_states,
+    get_feed_snapshots,
+    get_known_articles,
+    get_extraction_success_rates,
+    get_extractor_stats,
+    store_fetched_articles,
+)
+from .extraction_planner import unextractable_sources
+from .extractor_registry import ExtractorRegistry
+from .fetcher import Article, extract_full_texts, fetch_feed, load_entry_budgets, load_feeds_config
+from .health_recorder import HealthRecorder
+from .http_cassette import open_session
+from .scheduler import HostScheduler
+from .source_health import adaptive_timeout, next_poll_at, next_poll_interval
+from .text_store import TEXTS, TextHold
+from .workers import shutdown_process_pool
+
+
+class FetchDaemon:
+    """Polls feeds independently and writes new articles to the store."""
+
+    def __init__(self, config_path: str = "config/feeds.yaml"):
+        config = load_feeds_config(config_path)
+        self.feeds = [
+            (category, feed)
+            for category, category_feeds in config.get("sources", {}).items()
+            for feed in category_feeds
+        ]
+        self.fetch_config = config.get("fetch", {})
+        self.states: dict[str, dict] = {}
+        self.snapshots: dict[str, list[dict]] = {}
+        # Per source: hash -> {summary, full_text, fetched_at} of entries in the feed
+        self.known: dict[str, dict[str, dict]] = {}
+        self.session: aiohttp.ClientSession | None = None
+        self.scheduler: HostScheduler | None = None
+        self.skip_sources: set[str] = set()
+        self.registry: ExtractorRegistry | None = None
+        self.budgets: dict[str, int] = {}
+
+    async def _load_state(self):
+        self.states, known, self.snapshots = await asyncio.gather(
+            asyncio.to_thread(get_source_states),
+            asyncio.to_thread(get_known_articles),
+            asyncio.to_thread(get_feed_snapshots),
+        )
+        for article_hash, row in known.items():
+            self.known.setdefault(row["source"], {})[article_hash] = row
+        self.skip_sources = unextractable_sources(
+            await asyncio.to_thread(get_extraction_success_rates),
+            min_success_rate=self.fetch_config.get("extraction_min_success_rate", 0.05),
+        )
+        self.budgets = await asyncio.to_thread(load_entry_budgets, self.fetch_config)
+        self.registry = ExtractorRegistry.from_config(
+            self.fetch_config.get("extraction_rules"),
+            stats=await asyncio.to_thread(get_extractor_stats),
+        )
+
+    async def poll_feed(self, category: str, feed: dict) -> list[Article]:
+        """Fetch one feed, store its new articles and schedule its next poll.
+
+        Returns the new articles, with their full text released unless
+        another in-flight poll shares them.
+        """
+        # Stored text is loaded for known entries before the feed request,
+        # so those are held from the start; the rest once they're parsed.
+        # Stored and remembered in self.known, their text goes afterwards.
+        with TEXTS.holding(self.known.get(feed["name"], {})) as held:
+            return await self._poll(category, feed, held)
+
+    async def _poll(self, category: str, feed: dict, held: TextHold) -> list[Article]:
+        """poll_feed's work; hashes whose text it loads are added to held."""
+        fetch_config = self.fetch_config
+        name, url = feed["name"], feed["url"]
+        state = self.states.get(name)
+        known = self.known.get(name, {})
+        recorder = HealthRecorder()
+
+        articles = await fetch_feed(
+            session=self.session,
+            url=url,
+            source_name=name,
+            category=category,
+            language=feed.get("language", "en"),
+            reliability=feed.get("reliability", 0.75),
+            timeout=adaptive_timeout(
+                state,
+                ceiling=fetch_config.get("timeout", 30),
+                floor=fetch_config.get("timeout_floor", 5),
+                multiplier=fetch_config.get("timeout_p95_multiplier", 3.0),
+            ),
+            max_articles=self.budgets.get(name, fetch_config.get("max_articles_per_feed", 20)),
+            validators=state,
+            known=known,
+            scheduler=self.scheduler,
+            snapshot=self.snapshots.get(name),
+            recorder=recorder,
+            max_bytes=fetch_config.get("max_feed_bytes", 2_000_000),
+            rss_full_text_min=fetch_config.get("rss_full_text_min_chars", 1000),
+        )
+        new = [a for a in articles if a.article_hash not in known]
+        held.add(a.article_hash for a in new)
+        if new:
+            # Everything new is warmed, except from sources whose pages never extract
+            to_extract = [] if name in self.skip_sources else new
+            await extract_full_texts(
+                to_extract,
+                max_articles=len(to_extract),
+                cache_ttl_hours=fetch_config.get("extraction_cache_ttl_hours", 72),
+                failure_ttl_hours=fetch_config.get("extraction_failure_ttl_hours", 6),
+                session=self.session,
+                timeout=fetch_config.get("timeout", 30),
+                scheduler=self.scheduler,
+                max_page_bytes=fetch_config.get("max_page_bytes", 3_000_000),
+                registry=self.registry,
+            )
+            await asyncio.to_thread(
+                store_fetched_articles,
+                [dict(a.to_dict(), full_text=a.full_text) for a in new],
+            )
+
+        now = datetime.now()
+        interval = next_poll_interval(state, len(new), now)
+        recorder.poll(name, url, interval.total_seconds(), now + interval,
+                      last_new_entry_at=now if new else None)
+        for snap in recorder.snapshots:
+            self.snapshots[name] = snap["articles"]
+        await recorder.flush()
+
+        # Only entries still in the feed can come back, so that's all we keep
+        self.known[name] = {
+            a.article_hash: {
+                "summary": a.summary,
+                "full_text": a.full_text,
+                "fetched_at": known.get(a.article_hash, {}).get("fetched_at", now),
+            }
+            for a in articles
+        }
+        # Only this source's row changed
+        self.states.update(await asyncio.to_thread(get_source_states, [name]))
+
+        if new:
+            print(f"  [NEW] {name}: {len(new)} new, next poll in {interval.total_seconds() / 60:.0f} min")
+        return new
+
+    async def _poll_forever(self, category: str, feed: dict):
+        while True:
+            due = next_poll_at(self.states.get(feed["name"]))
+            delay = (due - datetime.now()).total_seconds()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                await self.poll_feed(category, feed)
+            except Exception as e:
+                print(f"  [WARN] {feed['name']}: poll failed: {type(e).__name__}: {e}")
+                await asyncio.sleep(60)
+
+    async def run(self, once: bool = False):
+        """Poll all feeds until cancelled, or each feed once if once is set."""
+        await self._load_state()
+
+        max_concurrency = self.fetch_config.get("max_concurrency", 10)
+        per_host = self.fetch_config.get("per_host_concurrency", 2)
+        self.scheduler = HostScheduler(max_concurrency=max_concurrency, per_host=per_host)
+        headers = {"User-Agent": self.fetch_config.get("user_agent", "NewsAggregator/1.0")}
+        connector = aiohttp.TCPConnector(limit=max_concurrency, limit_per_host=per_host, ssl=False)
+
+        async with open_session(headers=headers, connector=connector) as session:
+            self.session = session
+            if once:
+                results = await asyncio.gather(*(
+                    self.poll_feed(category, feed) for category, feed in self.feeds
+                ))
+                print(f"Stored {sum(len(r) for r in results)} new articles")
+                return
+
+            print(f"Polling {len(self.feeds)} feeds (Ctrl+C to stop)...")
+            await asyncio.gather(*(
+                self._poll_forever(category, feed) for category, feed in self.feeds
+            ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Continuous feed fetcher")
+    parser.add_argument("--feeds-config", default="config/feeds.yaml", help="Path to feeds config")
+    parser.add_argument("--once", action="store_true", help="Poll every feed once and exit")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(FetchDaemon(args.feeds_config).run(once=args.once))
+    except KeyboardInterrupt:
+        print("\nStopped")
+    finally:
+        shutdown_process_pool()
+
+
+if __name__ == "__main__":
+    main()
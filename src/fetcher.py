@@ -1,29 +1,61 @@
 """RSS feed fetcher with async support, health tracking, and full article extraction."""
 
 import asyncio
+import contextlib
 import hashlib
-from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Optional
+import importlib.util
+import time
+from dataclasses import InitVar, dataclass
+from datetime import datetime
+from typing import AsyncIterator, Optional
 
 import aiohttp
-import feedparser
 import yaml
-from dateutil import parser as date_parser
 
-from .database import record_source_health, get_unhealthy_sources
+from .database import (
+    get_unhealthy_sources,
+    get_source_states,
+    get_source_yields,
+    get_feed_snapshots,
+    get_known_articles,
+    get_recent_articles,
+    store_fetched_articles,
+    get_cached_extractions,
+    get_extraction_success_rates,
+    get_extractor_stats,
+    record_extractor_outcomes,
+    store_extractions,
+    store_fetch_telemetry,
+)
+from .extraction_planner import PreScorer, plan_extraction, unextractable_sources
+from .extractor import extract_text
+from .extractor_registry import PAGE_EXTRACTORS, ZERO_NETWORK, ExtractorRegistry, zero_network_text
+from .feed_parser import generate_article_hash, parse_feed
+from .health_recorder import HealthRecorder
+from .http_cassette import open_session
+from .scheduler import HostScheduler, interleave_by_host
+from .telemetry import DEFAULT_REPORT_DIR, FetchTelemetry
+from .text_store import TEXTS, release_filtered
+from .source_health import adaptive_timeout, breaker_state, entry_budgets
+from .utils.dates import first_seen, normalize_date
+from .utils.urls import canonicalize_url
+from .workers import run_in_process_pool, shutdown_process_pool
 
 
-def generate_article_hash(title: str, link: str) -> str:
-    """Generate a unique hash for an article."""
-    content = f"{title}:{link}".encode('utf-8')
-    return hashlib.md5(content).hexdigest()[:16]
+READ_CHUNK_BYTES = 64 * 1024
 
+# Seconds past the extraction deadline before a category's extraction is
+# cancelled outright (it normally stops itself at the deadline and stores)
+EXTRACT_CANCEL_GRACE = 5.0
 
-@dataclass
+
+@dataclass(slots=True)
 class Article:
-    """Normalized article from any RSS feed."""
+    """Normalized article from any RSS feed.
+
+    full_text lives in the shared text store (see text_store), so it can
+    be released as soon as the article is filtered out.
+    """
     title: str
     link: str
     summary: str
@@ -32,12 +64,14 @@ class Article:
     category: str
     language: str
     reliability: float
-    article_hash: str = field(default="")
-    full_text: str = field(default="")
+    article_hash: str = ""
+    full_text: InitVar[str] = ""
 
-    def __post_init__(self):
+    def __post_init__(self, full_text: str):
         if not self.article_hash:
             self.article_hash = generate_article_hash(self.title, self.link)
+        if full_text:
+            TEXTS.set(self.article_hash, full_text)
 
     def to_dict(self) -> dict:
         return {
@@ -52,6 +86,62 @@ class Article:
             "article_hash": self.article_hash,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "Article":
+        """Rebuild an article from to_dict() output."""
+        return cls(
+            title=data["title"],
+            link=data["link"],
+            summary=data.get("summary", ""),
+            source=data["source"],
+            published=parse_date(data.get("published")),
+            category=data["category"],
+            language=data.get("language", "en"),
+            reliability=data.get("reliability", 0.75),
+            article_hash=data.get("article_hash", ""),
+        )
+
+
+# Set after the class is built: a property in the class body would become
+# the default of the full_text init argument
+Article.full_text = property(
+    lambda self: TEXTS.get(self.article_hash),
+    lambda self, text: TEXTS.set(self.article_hash, text),
+)
+
+
+def merge_duplicate_articles(articles: list[Article]) -> tuple[list[Article], int]:
+    """
+    Collapse articles from different feeds that link to the same canonical URL.
+
+    The copy from the more reliable source wins (the earlier one on ties),
+    taking over the other's full text if it has none; the other's stored
+    text is released. Entries of a single feed sharing a URL are left
+    alone, since some feeds link every entry to one page.
+    Returns (articles in original order, number merged away).
+    """
+    kept: dict[str, Article] = {}
+    merged = set()
+    for article in articles:
+        if not article.link:
+            continue
+        key = canonicalize_url(article.link)
+        first = kept.get(key)
+        if first is None:
+            kept[key] = article
+            continue
+        if first.source == article.source:
+            continue
+        winner, loser = (first, article) if first.reliability >= article.reliability else (article, first)
+        if not winner.full_text and loser.full_text:
+            winner.full_text = loser.full_text
+        if loser.article_hash != winner.article_hash:
+            loser.full_text = ""
+        kept[key] = winner
+        merged.add(id(loser))
+
+    return [a for a in articles if id(a) not in merged], len(merged)
+
 
 def load_feeds_config(config_path: str = "config/feeds.yaml") -> dict:
     """Load feeds configuration from YAML."""
@@ -59,17 +149,118 @@ def load_feeds_config(config_path: str = "config/feeds.yaml") -> dict:
         return yaml.safe_load(f)
 
 
-def parse_date(date_str: Optional[str]) -> datetime:
-    """Parse date string to datetime, fallback to now if invalid."""
-    if not date_str:
-        return datetime.now(timezone.utc)
+def load_entry_budgets(fetch_config: dict) -> dict[str, int]:
+    """Per-source max_articles from downstream yield; sources not listed use the default."""
+    if not fetch_config.get("adaptive_articles_per_feed", True):
+        return {}
+    return entry_budgets(
+        get_source_yields(),
+        default=fetch_config.get("max_articles_per_feed", 20),
+        floor=fetch_config.get("articles_per_feed_floor", 5),
+        ceiling=fetch_config.get("articles_per_feed_ceiling", 60),
+    )
+
+
+def parse_date(
+    date_str: float | str | None,
+    source: str | None = None,
+    fallback: datetime | None = None,
+) -> datetime:
+    """Parse an entry date to datetime, fallback (or now) if missing or invalid."""
+    return normalize_date(date_str, source=source, fallback=fallback)
+
+
+def _request_slot(scheduler: HostScheduler | None, url: str):
+    """Scheduler slot for url, or a no-op when fetching unscheduled."""
+    return scheduler.slot(url) if scheduler is not None else contextlib.nullcontext()
+
+
+def _load_snapshot(snapshot: list[dict] | None, known: dict[str, dict]) -> list[Article] | None:
+    """Rebuild a feed's previously parsed entries, or None if never stored."""
+    if snapshot is None:
+        return None
+    articles = [Article.from_dict(d) for d in snapshot]
+    for article in articles:
+        cached = known.get(article.article_hash)
+        if cached and cached.get("full_text"):
+            article.full_text = cached["full_text"]
+    return articles
+
+
+async def _read_capped(resp: aiohttp.ClientResponse, max_bytes: int | None) -> tuple[bytes, bool]:
+    """Stream a response body, stopping after max_bytes. Returns (body, truncated)."""
+    if not max_bytes:
+        return await resp.read(), False
+    chunks = []
+    size = 0
+    async for chunk in resp.content.iter_chunked(READ_CHUNK_BYTES):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > max_bytes:
+            return b"".join(chunks)[:max_bytes], True
+    return b"".join(chunks), False
+
+
+def _trim_to_last_entry(content: bytes) -> bytes | None:
+    """Cut a truncated feed after its last complete item/entry, or None if none."""
+    end = max(content.rfind(b"</item>"), content.rfind(b"</entry>"))
+    if end < 0:
+        return None
+    return content[:content.index(b">", end) + 1]
+
+
+class StageDeadline:
+    """A loop.time() deadline that may be set after work started against it."""
+
+    def __init__(self, at: float | None = None):
+        self.at = at
+        self._set = asyncio.Event()
+        if at is not None:
+            self._set.set()
+
+    def set(self, at: float):
+        self.at = at
+        self._set.set()
+
+    async def wait_set(self):
+        await self._set.wait()
+
+
+async def gather_until(aws, deadline: float | StageDeadline | None) -> tuple[list, list[asyncio.Task]]:
+    """Run awaitables until a loop.time() deadline (None: until all finish).
+
+    A StageDeadline that isn't set yet is waited on until it is, then
+    honoured. Returns the results of those that finished, in input order,
+    and the tasks still running, which are left running for the caller.
+    If the call itself is cancelled, so are the tasks.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    if not tasks:
+        return [], []
+    holder = deadline if isinstance(deadline, StageDeadline) else StageDeadline(deadline)
+    loop = asyncio.get_running_loop()
+    all_done = asyncio.ensure_future(asyncio.wait(tasks))
     try:
-        dt = date_parser.parse(date_str)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt
-    except (ValueError, TypeError):
-        return datetime.now(timezone.utc)
+        while holder.at is None and not all_done.done():
+            waker = asyncio.ensure_future(holder.wait_set())
+            await asyncio.wait([all_done, waker], return_when=asyncio.FIRST_COMPLETED)
+            waker.cancel()
+        if not all_done.done():
+            await asyncio.wait([all_done], timeout=max(0.0, holder.at - loop.time()))
+    except asyncio.CancelledError:
+        for task in tasks:
+            task.cancel()
+        raise
+    finally:
+        all_done.cancel()
+    return [t.result() for t in tasks if t.done()], [t for t in tasks if not t.done()]
+
+
+async def cancel_tasks(tasks: list[asyncio.Task]):
+    """Cancel tasks and wait for them to unwind (releasing slots, closing responses)."""
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
 
 
 async def fetch_feed(
@@ -81,195 +272,756 @@ async def fetch_feed(
     reliability: float,
     timeout: int = 30,
     max_articles: int = 20,
+    validators: dict | None = None,
+    known: dict[str, dict] | None = None,
+    scheduler: HostScheduler | None = None,
+    snapshot: list[dict] | None = None,
+    recorder: HealthRecorder | None = None,
+    max_bytes: int | None = None,
+    rss_full_text_min: int = 1000,
+    telemetry: FetchTelemetry | None = None,
 ) -> list[Article]:
-    """Fetch and parse a single RSS feed."""
+    """Fetch and parse a single RSS feed.
+
+    validators carries the etag/last_modified/content_hash stored from the
+    previous fetch, and snapshot the entries parsed then. A 304, or a body
+    identical to last time, reuses the snapshot instead of re-parsing.
+    known maps this source's article hashes already in the article cache to
+    their stored summary/full_text, which are carried forward instead of
+    re-cleaning the entry HTML. Parsing runs in the shared process pool.
+    scheduler, if given, gates the download by host. Bodies are read up to
+    max_bytes; an oversized feed is cut back to its last complete entry.
+    Entries whose own content has rss_full_text_min characters of text use
+    it as full_text, so they are never sent for extraction. Phase timings
+    go to telemetry.
+
+    Health outcomes go to recorder; without one, they are flushed when
+    this feed is done.
+    """
+    if recorder is None:
+        recorder = HealthRecorder()
+        try:
+            return await fetch_feed(
+                session, url, source_name, category, language, reliability,
+                timeout, max_articles, validators, known, scheduler, snapshot, recorder,
+                max_bytes, rss_full_text_min, telemetry,
+            )
+        finally:
+            await recorder.flush()
+
     articles = []
+    validators = validators or {}
+    known = known or {}
+    telemetry = telemetry or FetchTelemetry()
 
     try:
-        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
-            if resp.status != 200:
-                print(f"  [WARN] {source_name}: HTTP {resp.status}")
-                record_source_health(source_name, url, success=False)
+        telemetry.record(url, kind="feed", source=source_name)
+
+        # Validators are only useful if the entries they vouch for are still stored
+        previous = _load_snapshot(snapshot, known) if validators else None
+        request_headers = {}
+        if previous is not None:
+            if validators.get("etag"):
+                request_headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                request_headers["If-Modified-Since"] = validators["last_modified"]
+
+        queued = time.monotonic()
+        async with _request_slot(scheduler, url):
+            started = time.monotonic()
+            telemetry.add(url, "queue", started - queued)
+            async with session.get(
+                url,
+                headers=request_headers,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+                trace_request_ctx=telemetry.request_ctx(url),
+            ) as resp:
+                status = resp.status
+                resp_headers = resp.headers
+                with telemetry.phase(url, "body"):
+                    if status == 200:
+                        content, truncated = await _read_capped(resp, max_bytes)
+                    else:
+                        content, truncated = b"", False
+            latency = time.monotonic() - started
+        size = len(content)
+        telemetry.record(url, status=status, bytes=size)
+
+        if status == 304 and previous is not None:
+            print(f"  [OK] {source_name}: not modified ({len(previous)} cached)")
+            recorder.success(source_name, url, len(previous), latency)
+            return previous
+
+        if status != 200:
+            if status in (429, 503) and scheduler is not None:
+                scheduler.backoff(url, resp_headers.get("Retry-After"))
+            print(f"  [WARN] {source_name}: HTTP {status}")
+            recorder.failure(source_name, url)
+            return []
+
+        if truncated:
+            content = _trim_to_last_entry(content)
+            if content is None:
+                print(f"  [WARN] {source_name}: over {max_bytes // 1024} KB with no complete entry")
+                recorder.failure(source_name, url)
                 return []
+            print(f"  [WARN] {source_name}: over {max_bytes // 1024} KB, truncated")
+
+        content_hash = hashlib.sha256(content).hexdigest()
+        etag = resp_headers.get("ETag")
+        last_modified = resp_headers.get("Last-Modified")
+
+        # Feeds that ignore validators: skip parsing if the body is unchanged
+        if previous is not None and content_hash == validators.get("content_hash"):
+            print(f"  [OK] {source_name}: unchanged ({len(previous)} cached)")
+            recorder.success(source_name, url, len(previous), latency, size, truncated)
+            if etag != validators.get("etag") or last_modified != validators.get("last_modified"):
+                recorder.snapshot(
+                    source_name, url, [a.to_dict() for a in previous],
+                    etag=etag, last_modified=last_modified, content_hash=content_hash,
+                )
+            return previous
 
-            content = await resp.text()
-            feed = feedparser.parse(content)
-
-            for entry in feed.entries[:max_articles]:
-                # Extract summary, preferring content over summary
-                summary = ""
-                if hasattr(entry, "content") and entry.content:
-                    summary = entry.content[0].get("value", "")
-                elif hasattr(entry, "summary"):
-                    summary = entry.summary or ""
-                elif hasattr(entry, "description"):
-                    summary = entry.description or ""
-
-                # Clean HTML from summary
-                from bs4 import BeautifulSoup
-                summary = BeautifulSoup(summary, "html.parser").get_text()[:500]
-
-                # Parse publication date
-                pub_date = None
-                for date_field in ["published", "updated", "created"]:
-                    if hasattr(entry, date_field):
-                        pub_date = getattr(entry, date_field)
-                        break
-
-                articles.append(Article(
-                    title=entry.get("title", "No title"),
-                    link=entry.get("link", ""),
-                    summary=summary.strip(),
-                    source=source_name,
-                    published=parse_date(pub_date),
-                    category=category,
-                    language=language,
-                    reliability=reliability,
-                ))
-
-            print(f"  [OK] {source_name}: {len(articles)} articles")
-            record_source_health(source_name, url, success=True, article_count=len(articles))
+        # Parse off the event loop; only compact entry tuples come back
+        with telemetry.phase(url, "parse"):
+            entries = await run_in_process_pool(
+                parse_feed,
+                content,
+                resp_headers.get("Content-Type", ""),
+                max_articles,
+                frozenset(known),
+                rss_full_text_min,
+            )
+
+        for title, link, article_hash, summary, pub_date, rss_text in entries:
+            # Already ingested on an earlier run: reuse stored text
+            cached = known.get(article_hash) if summary is None else None
+            # Undated entries keep the time we first saw them, not this run's now()
+            seen = known.get(article_hash)
+            articles.append(Article(
+                title=title,
+                link=link,
+                summary=(cached.get("summary") or "") if cached else summary,
+                source=source_name,
+                published=parse_date(
+                    pub_date, source_name, first_seen(seen["fetched_at"]) if seen else None,
+                ),
+                category=category,
+                language=language,
+                reliability=reliability,
+                article_hash=article_hash,
+                full_text=(cached.get("full_text") or "") if cached else rss_text,
+            ))
+
+        print(f"  [OK] {source_name}: {len(articles)} articles")
+        recorder.success(source_name, url, len(articles), latency, size, truncated)
+        recorder.snapshot(
+            source_name, url, [a.to_dict() for a in articles],
+            etag=etag, last_modified=last_modified, content_hash=content_hash,
+        )
 
     except asyncio.TimeoutError:
         print(f"  [WARN] {source_name}: Timeout")
-        record_source_health(source_name, url, success=False)
+        recorder.failure(source_name, url)
+        telemetry.record(url, error="timeout")
     except Exception as e:
         print(f"  [WARN] {source_name}: {type(e).__name__}: {e}")
-        record_source_health(source_name, url, success=False)
+        recorder.failure(source_name, url)
+        telemetry.record(url, error=type(e).__name__)
 
     return articles
 
 
-async def fetch_all_feeds(config_path: str = "config/feeds.yaml") -> list[Article]:
-    """Fetch all feeds from configuration."""
+class IngestIndex:
+    """
+    Cross-feed dedup while feeds are still arriving (see merge_duplicate_articles).
+
+    Articles are indexed by canonical URL. A copy from another source
+    replaces an earlier, less reliable one, unless the earlier one's
+    category has already been released downstream.
+    """
+
+    def __init__(self):
+        self._by_url: dict[str, Article] = {}
+        # Losers by id; holding them keeps their ids from being reused
+        self._dropped: dict[int, Article] = {}
+        self.released: set[str] = set()
+        self.merged = 0
+
+    def add(self, articles: list[Article]):
+        for article in articles:
+            if not article.link:
+                continue
+            key = canonicalize_url(article.link)
+            first = self._by_url.get(key)
+            if first is None:
+                self._by_url[key] = article
+                continue
+            if first.source == article.source:
+                continue
+            if first.category in self.released or first.reliability >= article.reliability:
+                winner, loser = first, article
+            else:
+                winner, loser = article, first
+            if not winner.full_text and loser.full_text and winner.category not in self.released:
+                winner.full_text = loser.full_text
+            if loser.article_hash != winner.article_hash:
+                loser.full_text = ""
+            self._by_url[key] = winner
+            self._dropped[id(loser)] = loser
+            self.merged += 1
+
+    def kept(self, articles: list[Article]) -> list[Article]:
+        """articles without those merged into another feed's copy."""
+        return [a for a in articles if id(a) not in self._dropped]
+
+
+async def fetch_all_feeds(
+    config_path: str = "config/feeds.yaml",
+    curation_config_path: str = "config/curation.yaml",
+) -> list[Article]:
+    """Fetch all feeds from configuration, newest first.
+
+    Collects stream_feeds(); see there for extraction and stage deadlines.
+    """
+    all_articles = []
+    async for _, articles in stream_feeds(config_path, curation_config_path):
+        all_articles.extend(articles)
+    all_articles.sort(key=lambda a: a.published, reverse=True)
+    return all_articles
+
+
+async def stream_feeds(
+    config_path: str = "config/feeds.yaml",
+    curation_config_path: str = "config/curation.yaml",
+) -> AsyncIterator[tuple[str, list[Article]]]:
+    """
+    Fetch all feeds, yielding (category, articles) as each category completes.
+
+    Fetching, ingest and extraction overlap. Each feed's entries go through
+    a bounded queue (a slow consumer holds the fetchers back) into
+    cross-feed dedup and pre-scoring as they arrive. When a category's last
+    feed is in, its extraction is planned against its section quota and
+    started; the category is yielded, newest first, once that finishes.
+    Storing and health writes happen after the last category, so consume
+    the iterator to the end.
+
+    With fetch.feed_stage_budget set, categories still waiting on feeds are
+    released at the deadline. Late feeds keep running until the extraction
+    deadline (extract_stage_budget after the feed stage ends); their
+    articles are stored for the next run but not yielded. Extractions still
+    running at the extraction deadline are cancelled.
+    """
     config = load_feeds_config(config_path)
     sources = config.get("sources", {})
     fetch_config = config.get("fetch", {})
 
     timeout = fetch_config.get("timeout", 30)
+    timeout_floor = fetch_config.get("timeout_floor", 5)
+    timeout_multiplier = fetch_config.get("timeout_p95_multiplier", 3.0)
     max_articles = fetch_config.get("max_articles_per_feed", 20)
+    max_feed_bytes = fetch_config.get("max_feed_bytes", 2_000_000)
+    max_page_bytes = fetch_config.get("max_page_bytes", 3_000_000)
+    rss_full_text_min = fetch_config.get("rss_full_text_min_chars", 1000)
     user_agent = fetch_config.get("user_agent", "NewsAggregator/1.0")
+    feed_budget = fetch_config.get("feed_stage_budget")
+    extract_budget = fetch_config.get("extract_stage_budget")
+    oversample = fetch_config.get("extraction_oversample", 1.5)
 
-    all_articles = []
+    recorder = HealthRecorder()
+    telemetry = FetchTelemetry()
+
+    # Load stored state off the event loop
+    source_states, known, snapshots, budgets, rates, extractor_stats, scorer = await asyncio.gather(
+        asyncio.to_thread(get_source_states),
+        asyncio.to_thread(get_known_articles),
+        asyncio.to_thread(get_feed_snapshots),
+        asyncio.to_thread(load_entry_budgets, fetch_config),
+        asyncio.to_thread(get_extraction_success_rates),
+        asyncio.to_thread(get_extractor_stats),
+        asyncio.to_thread(PreScorer, curation_config_path),
+    )
+    skip_sources = unextractable_sources(
+        rates, min_success_rate=fetch_config.get("extraction_min_success_rate", 0.05),
+    )
+    registry = ExtractorRegistry.from_config(fetch_config.get("extraction_rules"), stats=extractor_stats)
+
+    # Each feed's parse worker only needs that source's hashes
+    known_by_source: dict[str, dict[str, dict]] = {}
+    for article_hash, row in known.items():
+        known_by_source.setdefault(row["source"], {})[article_hash] = row
+
+    max_concurrency = fetch_config.get("max_concurrency", 10)
+    per_host = fetch_config.get("per_host_concurrency", 2)
+    scheduler = HostScheduler(max_concurrency=max_concurrency, per_host=per_host)
 
     headers = {"User-Agent": user_agent}
-    connector = aiohttp.TCPConnector(limit=10, ssl=False)
-
-    async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
-        tasks = []
-
-        for category, feeds in sources.items():
-            for feed in feeds:
-                tasks.append(fetch_feed(
-                    session=session,
-                    url=feed["url"],
-                    source_name=feed["name"],
-                    category=category,
-                    language=feed.get("language", "en"),
-                    reliability=feed.get("reliability", 0.75),
-                    timeout=timeout,
-                    max_articles=max_articles,
-                ))
-
-        print(f"Fetching {len(tasks)} feeds...")
-        results = await asyncio.gather(*tasks)
-
-        for articles in results:
-            all_articles.extend(articles)
-
-    # Sort by date, newest first
-    all_articles.sort(key=lambda a: a.published, reverse=True)
+    connector = aiohttp.TCPConnector(limit=max_concurrency, limit_per_host=per_host, ssl=False)
+
+    async with open_session(
+        headers=headers, connector=connector, trace_configs=[telemetry.trace_config()],
+    ) as session:
+        feeds = [
+            (category, feed)
+            for category, category_feeds in sources.items()
+            for feed in category_feeds
+        ]
+        # (category, articles) per finished feed; bounded for backpressure
+        ingest: asyncio.Queue = asyncio.Queue(maxsize=fetch_config.get("ingest_queue_size", 2 * max_concurrency))
+        producers: list[asyncio.Task] = []
+        waiting = {category: 0 for category in sources}  # Feeds still due per category
+        circuit_open = []
+
+        async def _produce(category: str, fetch):
+            # Report in even if the fetch blew up, or the category's
+            # countdown in waiting never reaches zero (cancellation only
+            # comes after the feed stage, and still propagates)
+            articles = []
+            try:
+                articles = await fetch
+            except Exception as e:
+                print(f"  [WARN] {asyncio.current_task().get_name()}: {type(e).__name__}: {e}")
+            await ingest.put((category, articles))
+
+        # Interleave hosts so e.g. five reddit feeds don't queue up front
+        for category, feed in interleave_by_host(feeds, lambda f: f[1]["url"]):
+            state = source_states.get(feed["name"])
+            feed_timeout = adaptive_timeout(
+                state,
+                ceiling=timeout,
+                floor=timeout_floor,
+                multiplier=timeout_multiplier,
+            )
+
+            # Failing sources with an open circuit are skipped until their next probe
+            breaker = breaker_state(state)
+            if breaker == "open":
+                circuit_open.append(feed["name"])
+                recorder.skip(feed["name"], feed_timeout)
+                continue
+            if breaker == "half_open":
+                print(f"  [PROBE] {feed['name']}: circuit half-open, probing")
+
+            waiting[category] += 1
+            producers.append(asyncio.create_task(_produce(category, fetch_feed(
+                session=session,
+                url=feed["url"],
+                source_name=feed["name"],
+                category=category,
+                language=feed.get("language", "en"),
+                reliability=feed.get("reliability", 0.75),
+                timeout=feed_timeout,
+                max_articles=budgets.get(feed["name"], max_articles),
+                validators=state,
+                known=known_by_source.get(feed["name"], {}),
+                scheduler=scheduler,
+                snapshot=snapshots.get(feed["name"]),
+                recorder=recorder,
+                max_bytes=max_feed_bytes,
+                rss_full_text_min=rss_full_text_min,
+                telemetry=telemetry,
+            )), name=feed["name"]))
+
+        if budgets:
+            lowered = sum(1 for b in budgets.values() if b < max_articles)
+            raised = sum(1 for b in budgets.values() if b > max_articles)
+            print(f"  Entry budgets from yield: {lowered} feeds lowered, {raised} raised"
+                  f" (default {max_articles})")
+        if circuit_open:
+            print(f"  [SKIP] Circuit open ({len(circuit_open)}): {', '.join(circuit_open)}")
+        print(f"Fetching {len(producers)} feeds...")
+
+        loop = asyncio.get_running_loop()
+        feed_deadline = loop.time() + feed_budget if feed_budget else None
+        # Set when the feed stage closes; categories released before then
+        # already extract against it
+        extract_deadline = StageDeadline()
+        feeds_open = True
+
+        index = IngestIndex()
+        arrived: dict[str, list[Article]] = {category: [] for category in sources}
+        released: dict[str, list[Article]] = {}
+        scores: dict[str, float] = {}
+        extracting: dict[asyncio.Task, str] = {}
+        late_articles: list[Article] = []
+        late_feeds = 0
+        planned_total = 0
+
+        async def _extract(category: str, articles: list[Article], planned: list[Article]):
+            if not planned:
+                articles.sort(key=lambda a: a.published, reverse=True)
+                return articles
+            await extract_full_texts(
+                planned,
+                max_articles=len(planned),
+                cache_ttl_hours=fetch_config.get("extraction_cache_ttl_hours", 72),
+                failure_ttl_hours=fetch_config.get("extraction_failure_ttl_hours", 6),
+                session=session,
+                timeout=timeout,
+                scheduler=scheduler,
+                max_page_bytes=max_page_bytes,
+                telemetry=telemetry,
+                registry=registry,
+                deadline=extract_deadline,
+                label=category,
+            )
+            articles.sort(key=lambda a: a.published, reverse=True)
+            return articles
+
+        def _release(category: str):
+            """Plan and start a category's extraction; no more articles will join it."""
+            nonlocal planned_total
+            index.released.add(category)
+            articles = released[category] = index.kept(arrived.pop(category))
+            planned = plan_extraction(
+                articles, max_articles=80, oversample=oversample,
+                skip_sources=skip_sources, scorer=scorer, scores=scores,
+            )
+            planned_total += len(planned)
+            extracting[asyncio.create_task(_extract(category, articles, planned))] = category
+
+        def _close_feed_stage():
+            nonlocal feeds_open
+            feeds_open = False
+            late = [t for t in producers if not t.done()]
+            if late:
+                print(f"  [LATE] {len(late)} feeds past the {feed_budget}s budget:"
+                      f" {', '.join(t.get_name() for t in late)}")
+            if extract_budget:
+                extract_deadline.set(loop.time() + extract_budget)
+            for category in list(arrived):
+                _release(category)
+
+        for category in [c for c, n in waiting.items() if not n]:
+            _release(category)
+
+        def _stage_end() -> float | None:
+            # Extractions cut themselves off at the deadline and still cache
+            # what finished; only those overrunning that are hard-cancelled
+            if extract_deadline.at is None:
+                return None
+            return extract_deadline.at + (EXTRACT_CANCEL_GRACE if extracting else 0.0)
+
+        getter = None
+        while True:
+            if feeds_open and (not any(waiting.values())
+                               or (feed_deadline is not None and loop.time() >= feed_deadline)):
+                _close_feed_stage()
+            if not feeds_open and _stage_end() is not None and loop.time() >= _stage_end():
+                break
+
+            # Keep draining the queue while fetchers run; after the feed
+            # stage, what arrives is late
+            if getter is None and (not ingest.empty() or any(not t.done() for t in producers)):
+                getter = asyncio.ensure_future(ingest.get())
+            waiters = set(extracting) | ({getter} if getter else set())
+            if not waiters:
+                break
+            deadline = feed_deadline if feeds_open else _stage_end()
+            done, _ = await asyncio.wait(
+                waiters,
+                timeout=None if deadline is None else max(0.0, deadline - loop.time()),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+
+            if getter in done:
+                category, articles = getter.result()
+                getter = None
+                if category in index.released:
+                    late_feeds += 1
+                    late_articles.extend(articles)
+                else:
+                    index.add(articles)
+                    arrived[category].extend(articles)
+                    scores.update(await asyncio.to_thread(scorer.score_all, articles))
+                    waiting[category] -= 1
+                    if not waiting[category]:
+                        _release(category)
+
+            for task in [t for t in done if t in extracting]:
+                yield extracting.pop(task), task.result()
+
+        # Extraction deadline (or nothing left): cancel what's still running
+        if getter is not None:
+            await cancel_tasks([getter])
+        unfinished = [t for t in producers if not t.done()]
+        await cancel_tasks(unfinished)
+        while not ingest.empty():
+            late_articles.extend(ingest.get_nowait()[1])
+        if extracting:
+            print(f"  [LATE] Extraction cut off at the stage deadline for: {', '.join(extracting.values())}")
+            await cancel_tasks(list(extracting))
+            for category in extracting.values():
+                articles = released[category]
+                articles.sort(key=lambda a: a.published, reverse=True)
+                yield category, articles
+        if late_feeds or unfinished:
+            print(f"  [LATE] {late_feeds} late feeds finished ({len(late_articles)} articles"
+                  f" stored for the next run), {len(unfinished)} cancelled")
+
+        busiest = scheduler.report()
+        if busiest:
+            waits = ", ".join(
+                f"{host} {stats.total_wait:.1f}s/{stats.requests} req" for host, stats in busiest
+            )
+            print(f"  Host queue wait: {waits}")
+
+    # One transaction for the whole run's health, validators and snapshots
+    await recorder.flush()
 
+    all_articles = [a for articles in released.values() for a in articles]
+    from_feed = sum(1 for a in all_articles if a.full_text)
     print(f"Total: {len(all_articles)} articles")
+    if index.merged:
+        print(f"  Merged {index.merged} cross-feed duplicates")
+    print(f"  Planned extraction for {planned_total}/{len(all_articles)} articles"
+          f" ({len(skip_sources)} low-yield sources skipped); {from_feed} have full text")
 
     # Report unhealthy sources
-    unhealthy = get_unhealthy_sources()
+    unhealthy = await asyncio.to_thread(get_unhealthy_sources)
     if unhealthy:
         print(f"  Unhealthy sources ({len(unhealthy)}): {', '.join(unhealthy)}")
 
-    # Extract full article text for top articles
-    print("Extracting full article text...")
-    all_articles = await extract_full_texts(all_articles, max_articles=80)
+    await asyncio.to_thread(store_fetched_articles, [
+        dict(a.to_dict(), full_text=a.full_text) for a in all_articles + late_articles
+    ])
+    # Late articles are only for the store
+    release_filtered(late_articles, all_articles)
 
-    return all_articles
+    # Per-request timing breakdown: JSON run report plus fetch_telemetry rows
+    telemetry.print_summary()
+    report = await asyncio.to_thread(
+        telemetry.write_report, fetch_config.get("telemetry_dir", DEFAULT_REPORT_DIR),
+    )
+    await asyncio.to_thread(store_fetch_telemetry, telemetry.run_id, telemetry.rows())
+    print(f"  Telemetry report: {report}")
+
+
+async def _download_page(
+    session: aiohttp.ClientSession,
+    url: str,
+    timeout: int,
+    max_bytes: int | None = None,
+    telemetry: FetchTelemetry | None = None,
+) -> tuple[Optional[str], Optional[str], int, bool]:
+    """Download an article page, returning (html, failure_reason, size, truncated).
+
+    Pages over max_bytes are cut off there; article text is near the top,
+    and trafilatura copes with the unclosed markup.
+    """
+    telemetry = telemetry or FetchTelemetry()
+    try:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout),
+                               trace_request_ctx=telemetry.request_ctx(url)) as resp:
+            telemetry.record(url, status=resp.status)
+            if resp.status != 200:
+                return None, f"http_{resp.status}", 0, False
+            content_type = resp.headers.get("Content-Type", "")
+            if content_type and "html" not in content_type:
+                return None, "not_html", 0, False
+            with telemetry.phase(url, "body"):
+                body, truncated = await _read_capped(resp, max_bytes)
+            telemetry.record(url, bytes=len(body))
+            return body.decode(resp.charset or "utf-8", errors="replace"), None, len(body), truncated
+    except asyncio.TimeoutError:
+        return None, "timeout", 0, False
+    except LookupError:
+        return None, "download: unknown charset", 0, False
+    except Exception as e:
+        return None, f"download: {type(e).__name__}", 0, False
 
 
 async def extract_full_texts(
     articles: list[Article],
     max_articles: int = 80,
+    cache_ttl_hours: int = 72,
+    failure_ttl_hours: int = 6,
+    session: Optional[aiohttp.ClientSession] = None,
+    timeout: int = 30,
+    scheduler: Optional[HostScheduler] = None,
+    max_page_bytes: int | None = None,
+    telemetry: FetchTelemetry | None = None,
+    registry: ExtractorRegistry | None = None,
+    deadline: float | StageDeadline | None = None,
+    label: str | None = None,
 ) -> list[Article]:
-    """Extract full article text using trafilatura for top articles."""
-    try:
-        import trafilatura
-    except ImportError:
+    """Extract full article text for top articles.
+
+    The registry picks each URL's extractors. Zero-network ones (feed
+    content, arXiv abstracts) run first; page extractors share one
+    download on the given aiohttp session (one is created if omitted),
+    gated per publisher by the scheduler, reading at most max_page_bytes,
+    and run in the shared process pool. Page results (including failures)
+    are cached by canonical URL, so pages extracted or found unextractable
+    on a recent run are not downloaded again. Extractions still running at
+    the loop.time() deadline (which may be a StageDeadline set later) are
+    cancelled and keep their summaries.
+    """
+    if importlib.util.find_spec("trafilatura") is None:
         print("  [WARN] trafilatura not installed, using RSS summaries only")
         return articles
 
-    # Only extract for top N articles (sorted by date already)
-    to_extract = articles[:max_articles]
+    telemetry = telemetry or FetchTelemetry()
+    if session is None:
+        async with open_session(trace_configs=[telemetry.trace_config()]) as own_session:
+            return await extract_full_texts(
+                articles, max_articles, cache_ttl_hours, failure_ttl_hours,
+                session=own_session, timeout=timeout, scheduler=scheduler,
+                max_page_bytes=max_page_bytes, telemetry=telemetry, registry=registry,
+                deadline=deadline, label=label,
+            )
+
+    # Only extract for top N articles (sorted by date already), skipping
+    # those whose full text was carried forward from an earlier run
+    window = articles[:max_articles]
+    pending = [a for a in window if not a.full_text]
+    carried = len(window) - len(pending)
     skipped = articles[max_articles:]
 
-    loop = asyncio.get_event_loop()
-    executor = ThreadPoolExecutor(max_workers=10)
+    # Serve what we can from the extraction cache
+    cached = await asyncio.to_thread(
+        get_cached_extractions,
+        [canonicalize_url(a.link) for a in pending if a.link],
+        ttl_hours=cache_ttl_hours,
+        failure_ttl_hours=failure_ttl_hours,
+    )
+    to_extract = []
+    cache_hits = 0
+    for article in pending:
+        hit = cached.get(canonicalize_url(article.link)) if article.link else None
+        if hit is None:
+            to_extract.append(article)
+            continue
+        cache_hits += 1
+        if hit["text"]:
+            article.full_text = hit["text"][:3000]
 
-    def _extract_one(article: Article) -> Article:
-        """Extract full text for a single article."""
+    scheduler = scheduler or HostScheduler()
+    if registry is None:
+        registry = ExtractorRegistry(stats=await asyncio.to_thread(get_extractor_stats))
+    # (domain, extractor, success, seconds) for the registry's stats
+    outcomes: list[tuple[str, str, bool, float]] = []
+
+    async def _extract_one(article: Article) -> dict | None:
+        """Extract full text for a single article.
+
+        Returns an extraction_cache row for page extractions, or None when
+        the text came from the feed entry or the registry skips the URL.
+        """
         if not article.link:
-            return article
+            return None
 
-        # Reddit posts: use RSS summary as full_text (trafilatura can't extract reddit)
-        if 'reddit.com' in article.link:
-            if article.summary and len(article.summary) > 100:
-                article.full_text = article.summary[:3000]
-            return article
+        chain, min_length = registry.order_for(article.link)
+        domain = registry.domain(article.link)
 
-        # GitHub repos (trending): use RSS summary (repo description + stats)
-        if 'github.com' in article.link and '/trending' not in article.link:
-            if article.summary and len(article.summary) > 50:
-                article.full_text = article.summary[:3000]
-            return article
+        # Free extractors first: the feed entry may already hold enough text
+        for extractor in (e for e in chain if e in ZERO_NETWORK):
+            text = zero_network_text(extractor, article.summary or "")
+            success = len(text) > min_length
+            outcomes.append((domain, extractor, success, 0.0))
+            if success:
+                article.full_text = text[:3000]
+                return None
 
-        try:
-            downloaded = trafilatura.fetch_url(article.link)
-            if downloaded:
-                text = trafilatura.extract(
-                    downloaded,
-                    include_comments=False,
-                    include_tables=False,
-                    no_fallback=True,
-                )
-                if text and len(text) > 100:
-                    article.full_text = text[:3000]  # Cap at 3000 chars
-        except Exception:
-            pass  # Silently fall back to RSS summary
+        page_extractors = tuple(e for e in chain if e in PAGE_EXTRACTORS)
+        if not page_extractors:
+            return None
 
-        # Fallback: newspaper4k if trafilatura didn't get text
-        if not article.full_text:
+        started = time.monotonic()
+        telemetry.record(article.link, kind="page", source=article.source)
+        queued = time.monotonic()
+        async with scheduler.slot(article.link):
+            telemetry.add(article.link, "queue", time.monotonic() - queued)
+            html, failure, size, truncated = await _download_page(
+                session, article.link, timeout, max_page_bytes, telemetry,
+            )
+        if failure in ("http_429", "http_503"):
+            scheduler.backoff(article.link)
+
+        text, extractor = None, None
+        if html:
             try:
-                from newspaper import Article as NewsArticle
-                news_article = NewsArticle(article.link)
-                news_article.download()
-                news_article.parse()
-                if news_article.text and len(news_article.text) > 100:
-                    article.full_text = news_article.text[:3000]
-            except Exception:
-                pass
+                with telemetry.phase(article.link, "extract"):
+                    text, extractor, failure = await run_in_process_pool(
+                        extract_text, article.link, html, page_extractors,
+                    )
+            except Exception as e:
+                failure = f"parse: {type(e).__name__}"
+        if failure:
+            telemetry.record(article.link, error=failure)
+
+        # Download failures say nothing about the extractors
+        if html:
+            elapsed = time.monotonic() - started
+            tried = page_extractors[:page_extractors.index(extractor) + 1] if extractor else page_extractors
+            outcomes.extend((domain, e, e == extractor, elapsed) for e in tried)
+
+        if text:
+            article.full_text = text[:3000]  # Cap at 3000 chars
 
-        return article
+        return {
+            "url": canonicalize_url(article.link),
+            "text": text,
+            "extractor": extractor,
+            "failure_reason": failure,
+            "page_bytes": size,
+            "truncated": truncated,
+            "source": article.source,
+        }
 
-    # Run extractions concurrently in thread pool
-    tasks = [loop.run_in_executor(executor, _extract_one, a) for a in to_extract]
-    extracted = await asyncio.gather(*tasks)
+    ordered = interleave_by_host(to_extract, lambda a: a.link)
+    tasks = [asyncio.ensure_future(_extract_one(a)) for a in ordered]
+    results, late = await gather_until(tasks, deadline)
+    if late:
+        await cancel_tasks(late)
+        for article, task in zip(ordered, tasks):
+            if task in late:
+                telemetry.record(article.link, error="deadline")
+        print(f"  [LATE] Cancelled {len(late)} page extractions at the stage deadline")
+    await asyncio.to_thread(store_extractions, [r for r in results if r])
+    await asyncio.to_thread(record_extractor_outcomes, outcomes)
 
-    extracted_count = sum(1 for a in extracted if a.full_text)
-    print(f"  Extracted full text for {extracted_count}/{len(to_extract)} articles")
+    extracted_count = sum(1 for a in to_extract if a.full_text)
+    prefix = f"  [{label}] " if label else "  "
+    print(f"{prefix}Extracted full text for {extracted_count}/{len(to_extract)} articles"
+          f" ({carried} carried forward, {cache_hits} from extraction cache)")
 
-    return list(extracted) + skipped
+    # Preserve newest-first order across extracted and carried articles
+    return window + skipped
 
 
-def fetch_feeds_sync(config_path: str = "config/feeds.yaml") -> list[Article]:
+def load_stored_articles(hours: int = 24) -> list[Article]:
+    """Articles stored in the last N hours (e.g. by the fetch daemon), newest first."""
+    articles = [
+        Article(
+            title=row["title"],
+            link=row["url"],
+            summary=row["summary"] or "",
+            source=row["source"],
+            published=parse_date(row["published_at"]),
+            category=row["category"],
+            language=row["language"] or "en",
+            reliability=row["reliability"] if row["reliability"] is not None else 0.75,
+            article_hash=row["article_hash"],
+            full_text=row["full_text"] or "",
+        )
+        for row in get_recent_articles(hours)
+    ]
+    articles.sort(key=lambda a: a.published, reverse=True)
+    articles, _ = merge_duplicate_articles(articles)
+    return articles
+
+
+def fetch_feeds_sync(
+    config_path: str = "config/feeds.yaml",
+    curation_config_path: str = "config/curation.yaml",
+) -> list[Article]:
     """Synchronous wrapper for fetch_all_feeds."""
-    return asyncio.run(fetch_all_feeds(config_path))
+    try:
+        return asyncio.run(fetch_all_feeds(config_path, curation_config_path))
+    finally:
+        # Parsing is done for this run; release the worker processes
+        shutdown_process_pool()
 
 
 if __name__ == "__main__":
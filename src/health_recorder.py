@@ -0,0 +1,76 @@
+"""In-memory collection of source health events during a fetch run.
+
+Fetch coroutines record outcomes here instead of writing to SQLite, and
+the whole run is flushed in one transaction off the event loop.
+"""
+
+import asyncio
+from datetime import datetime
+
+from .database import write_fetch_health
+
+
+class HealthRecorder:
+    """Buffers health events, circuit skips, feed snapshots and poll schedules."""
+
+    def __init__(self):
+        self.events: list[dict] = []
+        self.skips: list[tuple[str, float]] = []
+        self.snapshots: list[dict] = []
+        self.polls: list[dict] = []
+
+    def success(self, source_name: str, url: str, article_count: int,
+                latency: float | None = None, size: int | None = None,
+                truncated: bool = False):
+        self.events.append({
+            "source_name": source_name,
+            "url": url,
+            "success": True,
+            "article_count": article_count,
+            "latency": latency,
+            "bytes": size,
+            "truncated": truncated,
+            "at": datetime.now(),
+        })
+
+    def failure(self, source_name: str, url: str):
+        self.events.append({
+            "source_name": source_name,
+            "url": url,
+            "success": False,
+            "at": datetime.now(),
+        })
+
+    def skip(self, source_name: str, seconds_saved: float):
+        self.skips.append((source_name, seconds_saved))
+
+    def snapshot(self, source_name: str, url: str, articles: list[dict],
+                 etag: str | None, last_modified: str | None, content_hash: str | None):
+        self.snapshots.append({
+            "source_name": source_name,
+            "url": url,
+            "articles": articles,
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_hash": content_hash,
+        })
+
+    def poll(self, source_name: str, url: str, interval_seconds: float,
+             next_poll_at: datetime, last_new_entry_at: datetime | None = None):
+        self.polls.append({
+            "source_name": source_name,
+            "url": url,
+            "poll_interval": interval_seconds,
+            "next_poll_at": next_poll_at,
+            "last_new_entry_at": last_new_entry_at,
+        })
+
+    def flush_sync(self):
+        """Write everything recorded so far in one transaction."""
+        events, skips, snapshots, polls = self.events, self.skips, self.snapshots, self.polls
+        self.events, self.skips, self.snapshots, self.polls = [], [], [], []
+        write_fetch_health(events, skips, snapshots, polls)
+
+    async def flush(self):
+        """Write everything recorded so far without blocking the event loop."""
+        await asyncio.to_thread(self.flush_sync)
@@ -0,0 +1,190 @@
+"""Record/replay layer for the fetch stage's HTTP traffic.
+
+Set NEWS_CASSETTE_MODE=record to save every feed and article response to
+a cassette directory while fetching normally, and NEWS_CASSETTE_MODE=replay
+to serve them back with no network access. The fetch code is unchanged
+either way: it gets a session from open_session() and calls session.get().
+
+    NEWS_CASSETTE_MODE     record | replay (unset: live, no recording)
+    NEWS_CASSETTE_DIR      cassette store (default data/cassettes)
+    NEWS_CASSETTE_LATENCY  replay delay per response: "recorded" to replay
+                           each response's recorded time, or seconds
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+
+DEFAULT_CASSETTE_DIR = Path(__file__).parent.parent / "data" / "cassettes"
+
+# Validators are dropped when recording so the cassette holds full bodies
+_CONDITIONAL_HEADERS = ("If-None-Match", "If-Modified-Since")
+
+
+class CassetteStore:
+    """Recorded responses on disk, one meta JSON and one body file per URL."""
+
+    def __init__(self, root: Path | str = DEFAULT_CASSETTE_DIR):
+        self.root = Path(root)
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        base = self.root / key[:2] / key
+        return base.with_suffix(".json"), base.with_suffix(".body")
+
+    def save(self, url: str, status: int, headers, body: bytes, elapsed: float):
+        meta_path, body_path = self._paths(url)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        body_path.write_bytes(body)
+        meta_path.write_text(json.dumps({
+            "url": url,
+            "status": status,
+            "headers": list(headers.items()),
+            "elapsed": round(elapsed, 4),
+        }))
+
+    def load(self, url: str) -> tuple[dict, bytes] | None:
+        meta_path, body_path = self._paths(url)
+        if not meta_path.exists():
+            return None
+        return json.loads(meta_path.read_text()), body_path.read_bytes()
+
+
+class _StreamReader:
+    """The part of aiohttp's StreamReader the fetcher uses."""
+
+    def __init__(self, body: bytes):
+        self._body = body
+
+    async def iter_chunked(self, n: int):
+        for i in range(0, len(self._body), n):
+            yield self._body[i:i + n]
+
+
+class CassetteResponse:
+    """A recorded response, exposing the ClientResponse API the fetcher uses."""
+
+    def __init__(self, url: str, status: int, headers, body: bytes):
+        self.url = url
+        self.status = status
+        self.headers = CIMultiDictProxy(CIMultiDict(headers))
+        self.content = _StreamReader(body)
+        self._body = body
+
+    @property
+    def charset(self) -> str | None:
+        content_type = self.headers.get("Content-Type", "")
+        for param in content_type.split(";")[1:]:
+            name, _, value = param.strip().partition("=")
+            if name.lower() == "charset" and value:
+                return value.strip('"').lower()
+        return None
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self, encoding: str | None = None, errors: str = "strict") -> str:
+        return self._body.decode(encoding or self.charset or "utf-8", errors=errors)
+
+
+class CassetteSession:
+    """ClientSession stand-in that records to, or replays from, a CassetteStore.
+
+    Recording wraps a real session; replay needs none and raises
+    ClientConnectionError for URLs that were never recorded.
+    """
+
+    def __init__(self, store: CassetteStore, session: aiohttp.ClientSession | None = None,
+                 latency: str | float | None = None,
+                 connector: aiohttp.BaseConnector | None = None):
+        self.store = store
+        self.session = session
+        self.latency = latency
+        # Replay only: the caller's unused connector, closed with the session
+        self._connector = connector
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+        if self._connector is not None:
+            await self._connector.close()
+
+    @contextlib.asynccontextmanager
+    async def get(self, url: str, headers: dict | None = None,
+                  timeout: aiohttp.ClientTimeout | None = None, **kwargs):
+        if self.session is not None:
+            response = await self._record(url, headers, timeout, **kwargs)
+        else:
+            response = await self._replay(url, headers, timeout)
+        yield response
+
+    async def _record(self, url, headers, timeout, **kwargs) -> CassetteResponse:
+        headers = {k: v for k, v in (headers or {}).items() if k not in _CONDITIONAL_HEADERS}
+        started = time.monotonic()
+        async with self.session.get(url, headers=headers, timeout=timeout, **kwargs) as resp:
+            body = await resp.read()
+            status, resp_headers = resp.status, resp.headers
+        elapsed = time.monotonic() - started
+        await asyncio.to_thread(self.store.save, url, status, resp_headers, body, elapsed)
+        return CassetteResponse(url, status, resp_headers, body)
+
+    async def _replay(self, url, headers, timeout) -> CassetteResponse:
+        recorded = await asyncio.to_thread(self.store.load, url)
+        if recorded is None:
+            raise aiohttp.ClientConnectionError(f"no cassette for {url}")
+        meta, body = recorded
+
+        delay = meta["elapsed"] if self.latency == "recorded" else float(self.latency or 0)
+        if delay:
+            total = timeout.total if timeout is not None else None
+            if total is not None and delay > total:
+                await asyncio.sleep(total)
+                raise asyncio.TimeoutError()
+            await asyncio.sleep(delay)
+
+        # Answer validators the way the origin would have
+        response = CassetteResponse(url, meta["status"], meta["headers"], body)
+        etag = response.headers.get("ETag")
+        if response.status == 200 and etag and (headers or {}).get("If-None-Match") == etag:
+            return CassetteResponse(url, 304, [("ETag", etag)], b"")
+        return response
+
+
+def cassette_mode() -> str | None:
+    """The configured cassette mode ('record' or 'replay'), or None."""
+    mode = os.environ.get("NEWS_CASSETTE_MODE", "").strip().lower()
+    return mode if mode in ("record", "replay") else None
+
+
+def open_session(**session_kwargs):
+    """
+    HTTP session for the fetch stage.
+
+    A plain aiohttp.ClientSession unless NEWS_CASSETTE_MODE is set, in
+    which case responses are recorded to or replayed from the cassette store.
+    """
+    mode = cassette_mode()
+    if mode is None:
+        return aiohttp.ClientSession(**session_kwargs)
+
+    store = CassetteStore(os.environ.get("NEWS_CASSETTE_DIR") or DEFAULT_CASSETTE_DIR)
+    if mode == "record":
+        print(f"  [CASSETTE] Recording to {store.root}")
+        return CassetteSession(store, session=aiohttp.ClientSession(**session_kwargs))
+
+    latency = os.environ.get("NEWS_CASSETTE_LATENCY") or None
+    print(f"  [CASSETTE] Replaying from {store.root}")
+    return CassetteSession(store, latency=latency, connector=session_kwargs.get("connector"))
@@ -6,10 +6,10 @@ Read news briefs aloud using Microsoft's neural TTS voices.
 Supports reading summaries or fetching full article content.
 
 Usage:
-    python src/local_reader.py           # Read today's brief (summaries)
-    python src/local_reader.py --full    # Read with full articles
-    python src/local_reader.py --date 2026-02-03  # Read archived date
-    python src/local_reader.py --file index.html  # Read local file
+    python -m src.local_reader           # Read today's brief (summaries)
+    python -m src.local_reader --full    # Read with full articles
+    python -m src.local_reader --date 2026-02-03  # Read archived date
+    python -m src.local_reader --file index.html  # Read local file
 
 Interactive controls during playback:
     [Space] - Pause/Resume
@@ -36,6 +36,9 @@ import httpx
 import subprocess
 from bs4 import BeautifulSoup
 
+from .database import get_cached_extraction, store_extraction
+from .utils.urls import canonicalize_url
+
 # Article extraction
 try:
     from newspaper import Article as NewsArticle
@@ -137,11 +140,32 @@ def fetch_full_article(url: str) -> str | None:
     """
     Fetch full article content, bypassing paywalls when possible.
 
-    Tries multiple strategies in order:
+    Checks the shared extraction cache first, then tries multiple
+    strategies in order:
     1. newspaper3k - works for most sites without JS paywalls
     2. readability-lxml - better text extraction
     3. Direct HTML fetch as fallback
     """
+    cache_key = canonicalize_url(url)
+    cached = get_cached_extraction(cache_key)
+    if cached:
+        if cached["text"] and len(cached["text"]) > 200:
+            return clean_article_text(cached["text"])
+        if cached["failure_reason"]:
+            return None
+
+    text, extractor = _extract_full_article(url)
+    if text:
+        store_extraction(cache_key, text, extractor)
+        return clean_article_text(text)
+
+    if not cached:
+        store_extraction(cache_key, None, None, failure_reason="no_content")
+    return None
+
+
+def _extract_full_article(url: str) -> tuple[str | None, str | None]:
+    """Run the extraction strategies, returning (raw text, extractor name)."""
     # Strategy 1: newspaper3k
     if HAS_NEWSPAPER:
         try:
@@ -149,7 +173,7 @@ def fetch_full_article(url: str) -> str | None:
             article.download()
             article.parse()
             if article.text and len(article.text) > 200:
-                return clean_article_text(article.text)
+                return article.text, "newspaper"
         except Exception:
             pass
 
@@ -167,7 +191,7 @@ def fetch_full_article(url: str) -> str | None:
             soup = BeautifulSoup(doc.summary(), "html.parser")
             text = soup.get_text(separator="\n", strip=True)
             if text and len(text) > 200:
-                return clean_article_text(text)
+                return text, "readability"
         except Exception:
             pass
 
@@ -195,11 +219,11 @@ def fetch_full_article(url: str) -> str | None:
         if article_content:
             text = article_content.get_text(separator="\n", strip=True)
             if len(text) > 200:
-                return clean_article_text(text)
+                return text, "html"
     except Exception:
         pass
 
-    return None
+    return None, None
 
 
 def clean_article_text(text: str) -> str:
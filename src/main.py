@@ -8,19 +8,22 @@ from pathlib import Path
 # Add project root to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.fetcher import fetch_feeds_sync
-from src.curator import curate_articles
-from src.generator import generate_html
-from src.tts import (
-    generate_audio_brief,
-    generate_audio_brief_fr,
-    generate_deep_dive_audio,
-    generate_deep_dive_audio_fr,
-)
-from src.archive import archive_brief
-
 
 def main():
+    # Imported here, not at module level: process pool workers (see
+    # workers.py) re-import this script, and need none of the pipeline
+    from src.fetcher import fetch_feeds_sync, load_stored_articles
+    from src.curator import curate_articles
+    from src.generator import generate_html
+    from src.tts import (
+        generate_audio_brief,
+        generate_audio_brief_fr,
+        generate_deep_dive_audio,
+        generate_deep_dive_audio_fr,
+    )
+    from src.archive import archive_brief
+    from src.utils.memory import StageMemory
+
     parser = argparse.ArgumentParser(description="AI-curated news aggregator")
     parser.add_argument(
         "--no-tts",
@@ -47,11 +50,21 @@ def main():
         default="config/feeds.yaml",
         help="Path to feeds config"
     )
+    parser.add_argument(
+        "--from-store",
+        action="store_true",
+        help="Use articles stored by the fetch daemon instead of fetching feeds"
+    )
     parser.add_argument(
         "--curation-config",
         default="config/curation.yaml",
         help="Path to curation config"
     )
+    parser.add_argument(
+        "--memory-report",
+        action="store_true",
+        help="Print RSS and stored article text after each stage"
+    )
     parser.add_argument(
         "--output",
         default="index.html",
@@ -63,15 +76,26 @@ def main():
     print("=" * 50)
     print("NEWS BRIEF GENERATOR")
     print("=" * 50)
-
-    # Step 1: Fetch all RSS feeds
-    print("\n[1/7] Fetching RSS feeds...")
-    articles = fetch_feeds_sync(args.feeds_config)
+    memory = StageMemory()
+
+    # Step 1: Fetch all RSS feeds (or load what the fetch daemon stored)
+    articles = []
+    if args.from_store:
+        print("\n[1/7] Loading articles from store...")
+        articles = load_stored_articles()
+        print(f"  Loaded {len(articles)} articles from the last 24h")
+        if not articles:
+            print("  [WARN] Store is empty, fetching feeds instead")
+    if not articles:
+        print("\n[1/7] Fetching RSS feeds...")
+        articles = fetch_feeds_sync(args.feeds_config, args.curation_config)
 
     if not articles:
         print("ERROR: No articles fetched!")
         sys.exit(1)
 
+    memory.mark("fetch")
+
     # Step 2: Curate and score articles
     print("\n[2/7] Curating articles...")
     if args.no_ai:
@@ -83,6 +107,8 @@ def main():
     total_curated = sum(len(items) for items in sections.values())
     print(f"  Curated {total_curated} articles into {len(sections)} sections")
 
+    memory.mark("curate")
+
     # Step 3: Research top stories (Tavily)
     if not args.no_research:
         print("\n[3/7] Researching top stories...")
@@ -116,6 +142,8 @@ def main():
     else:
         print("\n[3/7] Skipping research (--no-research)")
 
+    memory.mark("research")
+
     # Step 4: Generate TTS audio
     audio_file = None
     audio_file_fr = None
@@ -144,6 +172,8 @@ def main():
     else:
         print("\n[4/7] Skipping TTS (--no-tts)")
 
+    memory.mark("audio")
+
     # Step 5: Generate deep dives
     deep_dives = []
     if not args.no_deep_dive and not args.no_tts:
@@ -223,6 +253,8 @@ def main():
     else:
         print("\n[5/7] Skipping deep dives")
 
+    memory.mark("deep_dives")
+
     # Step 6: Generate HTML
     print("\n[6/7] Generating HTML...")
     generate_html(
@@ -235,6 +267,8 @@ def main():
         output_path=args.output,
     )
 
+    memory.mark("html")
+
     # Step 7: Archive today's brief
     print("\n[7/7] Archiving brief...")
     archive_brief(
@@ -243,6 +277,10 @@ def main():
         has_audio=audio_file is not None,
     )
 
+    if args.memory_report:
+        print("\nMemory by stage:")
+        memory.print_report()
+
     print("\n" + "=" * 50)
     print("DONE!")
     print(f"Output: {args.output}")
@@ -0,0 +1,113 @@
+"""Host-aware request scheduling for feed and article fetching.
+
+Caps concurrent requests globally and per host so several feeds on one
+publisher (reddit, arxiv, CBC...) can't monopolize the connection pool,
+and records how long requests waited for a slot on each host.
+"""
+
+import asyncio
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterable, TypeVar
+from urllib.parse import urlsplit
+
+T = TypeVar("T")
+
+# Second-level labels under country TLDs (bbc.co.uk -> bbc.co.uk, not co.uk)
+_SECOND_LEVEL = {"co", "com", "org", "net", "gov", "ac", "gc"}
+
+
+def host_key(url: str) -> str:
+    """Group a URL by publisher: rss.arxiv.org and export.arxiv.org share a key."""
+    host = (urlsplit(url).hostname or "").lower()
+    labels = host.split(".")
+    if len(labels) <= 2 or labels[-1].isdigit() or ":" in host:
+        return host  # Bare domain or IP address
+    if len(labels[-1]) == 2 and labels[-2] in _SECOND_LEVEL:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+def interleave_by_host(items: Iterable[T], url_of: Callable[[T], str]) -> list[T]:
+    """Round-robin items across hosts so no host's requests are queued back to back."""
+    groups: dict[str, list[T]] = defaultdict(list)
+    for item in items:
+        groups[host_key(url_of(item))].append(item)
+
+    ordered = []
+    queues = list(groups.values())
+    for i in range(max((len(q) for q in queues), default=0)):
+        for queue in queues:
+            if i < len(queue):
+                ordered.append(queue[i])
+    return ordered
+
+
+@dataclass
+class HostStats:
+    """Queue-wait metrics for one host."""
+    requests: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    throttled: int = 0  # 429/503 responses that triggered a cooldown
+
+    @property
+    def avg_wait(self) -> float:
+        return self.total_wait / self.requests if self.requests else 0.0
+
+
+class HostScheduler:
+    """Global plus per-host concurrency limiter.
+
+    A request takes its host slot before a global slot, so requests piling
+    up behind one slow host never hold global capacity other hosts could use.
+    """
+
+    def __init__(self, max_concurrency: int = 10, per_host: int = 2):
+        self.max_concurrency = max_concurrency
+        self.per_host = per_host
+        self._global = asyncio.Semaphore(max_concurrency)
+        self._hosts: dict[str, asyncio.Semaphore] = {}
+        self._cooldown_until: dict[str, float] = {}
+        self.stats: dict[str, HostStats] = defaultdict(HostStats)
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """Hold a request slot for url's host for the duration of the block."""
+        host = host_key(url)
+        host_sem = self._hosts.setdefault(host, asyncio.Semaphore(self.per_host))
+        queued_at = time.monotonic()
+
+        async with host_sem:
+            # Honour a publisher's Retry-After before taking a global slot
+            delay = self._cooldown_until.get(host, 0.0) - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            async with self._global:
+                wait = time.monotonic() - queued_at
+                stats = self.stats[host]
+                stats.requests += 1
+                stats.total_wait += wait
+                stats.max_wait = max(stats.max_wait, wait)
+                yield
+
+    def backoff(self, url: str, retry_after: str | None = None, default: float = 5.0):
+        """Pause further requests to url's host after a 429/503."""
+        try:
+            seconds = min(float(retry_after), 60.0) if retry_after else default
+        except ValueError:
+            seconds = default
+        host = host_key(url)
+        self._cooldown_until[host] = max(
+            self._cooldown_until.get(host, 0.0),
+            time.monotonic() + seconds,
+        )
+        self.stats[host].throttled += 1
+
+    def report(self, limit: int = 5, min_wait: float = 0.1) -> list[tuple[str, HostStats]]:
+        """Hosts with the most total queue wait (at least min_wait seconds), worst first."""
+        ranked = sorted(self.stats.items(), key=lambda kv: kv[1].total_wait, reverse=True)
+        return [(host, s) for host, s in ranked[:limit] if s.total_wait >= min_wait]
@@ -0,0 +1,153 @@
+"""Per-source fetch policy derived from stored source health."""
+
+import json
+from datetime import datetime, timedelta
+
+
+def adaptive_timeout(
+    state: dict | None,
+    ceiling: float = 30,
+    floor: float = 5,
+    multiplier: float = 3.0,
+    min_samples: int = 3,
+) -> float:
+    """
+    Timeout for a source derived from its own p95 latency.
+
+    Uses multiplier x p95, clamped to [floor, ceiling]. Sources without
+    enough successful fetches on record get the full ceiling, and so do
+    sources whose last fetch failed (including half-open probes): only
+    successes are sampled, so a feed that slowed past its timeout could
+    otherwise never record a slower latency and would stay locked out.
+    """
+    if not state or state.get("consecutive_failures"):
+        return ceiling
+
+    p95 = state.get("latency_p95")
+    try:
+        samples = json.loads(state.get("latency_samples") or "[]")
+    except (json.JSONDecodeError, TypeError):
+        samples = []
+    if p95 is None or len(samples) < min_samples:
+        return ceiling
+
+    return max(floor, min(ceiling, p95 * multiplier))
+
+
+# Circuit breaker: consecutive failures before a source is skipped, and
+# the probe backoff (doubling per further failure) once it is open
+FAILURE_THRESHOLD = 3
+BASE_BACKOFF = timedelta(minutes=30)
+MAX_BACKOFF = timedelta(hours=24)
+
+
+def _parse_ts(value) -> datetime | None:
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def breaker_state(state: dict | None, now: datetime | None = None) -> str:
+    """
+    Effective circuit-breaker state for a source.
+
+    'closed' fetches normally, 'open' skips without network I/O, and
+    'half_open' means the backoff has elapsed and one probe fetch is due.
+    """
+    if not state or state.get("breaker_state") != "open":
+        return "closed"
+    now = now or datetime.now()
+    next_probe = _parse_ts(state.get("next_probe_at"))
+    if next_probe is None or now >= next_probe:
+        return "half_open"
+    return "open"
+
+
+def breaker_after_failure(consecutive_failures: int,
+                          now: datetime | None = None) -> tuple[str, datetime | None]:
+    """Breaker state and next probe time after a failed fetch."""
+    if consecutive_failures < FAILURE_THRESHOLD:
+        return "closed", None
+    now = now or datetime.now()
+    exponent = min(consecutive_failures - FAILURE_THRESHOLD, 10)
+    backoff = min(BASE_BACKOFF * (2 ** exponent), MAX_BACKOFF)
+    return "open", now + backoff
+
+
+# Daemon polling: aim for about two polls per observed gap between new
+# entries, backing off while a feed stays quiet
+DEFAULT_POLL_INTERVAL = timedelta(minutes=30)
+MIN_POLL_INTERVAL = timedelta(minutes=5)
+MAX_POLL_INTERVAL = timedelta(hours=6)
+QUIET_BACKOFF = 1.5
+POLL_SMOOTHING = 0.3
+
+
+def next_poll_interval(state: dict | None, new_entries: int,
+                       now: datetime | None = None) -> timedelta:
+    """
+    Poll interval for a source after a poll that found new_entries.
+
+    A poll with new entries moves the interval toward half the time since
+    the previous new entry (smoothed, so one burst doesn't swing it); a
+    quiet poll stretches it by QUIET_BACKOFF. Clamped to
+    [MIN_POLL_INTERVAL, MAX_POLL_INTERVAL].
+    """
+    now = now or datetime.now()
+    state = state or {}
+    seconds = state.get("poll_interval")
+    current = timedelta(seconds=seconds) if seconds else DEFAULT_POLL_INTERVAL
+
+    if new_entries:
+        last_new = _parse_ts(state.get("last_new_entry_at"))
+        if last_new is None:
+            interval = current
+        else:
+            target = (now - last_new) / 2
+            interval = current * (1 - POLL_SMOOTHING) + target * POLL_SMOOTHING
+    else:
+        interval = current * QUIET_BACKOFF
+
+    return max(MIN_POLL_INTERVAL, min(MAX_POLL_INTERVAL, interval))
+
+
+def next_poll_at(state: dict | None, now: datetime | None = None) -> datetime:
+    """When a source is next due; an open circuit defers it to its probe time."""
+    now = now or datetime.now()
+    state = state or {}
+    due = _parse_ts(state.get("next_poll_at")) or now
+    if breaker_state(state, now) == "open":
+        due = max(due, _parse_ts(state.get("next_probe_at")) or now)
+    return due
+
+
+def entry_budgets(
+    yields: dict[str, tuple[int, int]],
+    default: int = 20,
+    floor: int = 5,
+    ceiling: int = 60,
+    min_fetched: int = 40,
+) -> dict[str, int]:
+    """
+    Per-source max_articles from downstream yield (shown / fetched).
+
+    A source at the overall yield keeps the default; others scale with
+    their yield relative to it, clamped to [floor, ceiling], so sources
+    that never make a section drop to the floor. Sources with fewer than
+    min_fetched articles on record aren't listed (use default).
+    """
+    rated = {source: counts for source, counts in yields.items() if counts[0] >= min_fetched}
+    total_fetched = sum(fetched for fetched, _ in rated.values())
+    total_shown = sum(shown for _, shown in rated.values())
+    if not total_shown:
+        return {}
+    overall = total_shown / total_fetched
+    return {
+        source: max(floor, min(ceiling, round(default * shown / fetched / overall)))
+        for source, (fetched, shown) in rated.items()
+    }
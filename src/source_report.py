@@ -0,0 +1,59 @@
+"""Report feed source health and circuit-breaker states.
+
+Usage: python -m src.source_report [--all]
+"""
+
+import argparse
+from datetime import datetime
+
+from .database import get_source_states
+from .source_health import breaker_state
+
+
+def _format_ts(value) -> str:
+    if not value:
+        return "-"
+    return str(value)[:16]
+
+
+def print_source_report(show_all: bool = False):
+    """Print breaker state, failures, latency and time saved per source."""
+    states = get_source_states()
+    if not states:
+        print("No source health recorded yet")
+        return
+
+    now = datetime.now()
+    rows = []
+    for name, state in states.items():
+        effective = breaker_state(state, now)
+        if not show_all and effective == "closed" and not state.get("consecutive_failures"):
+            continue
+        rows.append((name, effective, state))
+
+    order = {"open": 0, "half_open": 1, "closed": 2}
+    rows.sort(key=lambda r: (order[r[1]], -(r[2].get("consecutive_failures") or 0), r[0]))
+
+    print(f"{'Source':<30} {'Breaker':<10} {'Fails':>5} {'Next probe':<17} "
+          f"{'p95':>6} {'Skips':>5} {'Saved':>8}")
+    for name, effective, state in rows:
+        p95 = state.get("latency_p95")
+        print(
+            f"{name[:30]:<30} {effective:<10} {state.get('consecutive_failures') or 0:>5} "
+            f"{_format_ts(state.get('next_probe_at')):<17} "
+            f"{f'{p95:.2f}s' if p95 is not None else '-':>6} "
+            f"{state.get('skipped_count') or 0:>5} "
+            f"{(state.get('time_saved_seconds') or 0):>7.0f}s"
+        )
+
+    open_count = sum(1 for _, effective, _ in rows if effective == "open")
+    total_saved = sum(s.get("time_saved_seconds") or 0 for s in states.values())
+    print(f"\n{len(states)} sources, {open_count} open circuits, "
+          f"{total_saved / 60:.1f} min of fetch time saved by skips")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Feed source health report")
+    parser.add_argument("--all", action="store_true", help="Include healthy sources")
+    args = parser.parse_args()
+    print_source_report(show_all=args.all)
@@ -0,0 +1,150 @@
+"""Per-request timing breakdown for a fetch run.
+
+aiohttp trace hooks time DNS, connect and time-to-first-byte; the fetcher
+times the host-slot wait, body read, feed parse and page extraction
+around its own calls. Each feed and article URL gets one record, keyed by
+the URL string the fetcher requested, written to a JSON run report and
+the fetch_telemetry table.
+"""
+
+import json
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+import aiohttp
+
+DEFAULT_REPORT_DIR = Path(__file__).parent.parent / "data" / "telemetry"
+
+# Timed phases, in request order
+PHASES = ("queue", "dns", "connect", "ttfb", "body", "parse", "extract")
+
+
+class FetchTelemetry:
+    """Collects per-URL timings for one fetch run."""
+
+    def __init__(self):
+        self.run_id = datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.started = time.monotonic()
+        self.records: dict[str, dict] = {}
+
+    def record(self, url: str, **fields):
+        """Set fields (kind, source, status, bytes, error...) on url's record."""
+        self.records.setdefault(url, {"url": url}).update(fields)
+
+    def add(self, url: str, phase: str, seconds: float):
+        """Add seconds to one of url's phases."""
+        record = self.records.setdefault(url, {"url": url})
+        record[phase] = round(record.get(phase, 0.0) + seconds, 4)
+
+    @contextmanager
+    def phase(self, url: str, phase: str):
+        """Time a block as one of url's phases."""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add(url, phase, time.monotonic() - started)
+
+    @staticmethod
+    def request_ctx(url: str) -> dict:
+        """trace_request_ctx for a request, so its trace timings land on url's record."""
+        return {"url": url}
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """TraceConfig recording DNS, connect and TTFB for each request."""
+        trace = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params):
+            # The caller's URL string, from session.get(..., trace_request_ctx=
+            # request_ctx(url)); params.url is yarl-normalized and may differ
+            ctx.url = (ctx.trace_request_ctx or {}).get("url") or str(params.url)
+            # Moved to when the connection is ready, so TTFB excludes DNS/connect
+            ctx.ttfb_start = time.monotonic()
+
+        async def on_dns_start(session, ctx, params):
+            ctx.dns_start = time.monotonic()
+
+        async def on_dns_end(session, ctx, params):
+            self.add(ctx.url, "dns", time.monotonic() - ctx.dns_start)
+
+        async def on_connect_start(session, ctx, params):
+            ctx.connect_start = time.monotonic()
+
+        async def on_connect_end(session, ctx, params):
+            # Includes DNS when the connection needed a lookup
+            elapsed = time.monotonic() - ctx.connect_start
+            dns = self.records.get(ctx.url, {}).get("dns", 0.0)
+            self.add(ctx.url, "connect", max(0.0, elapsed - dns))
+            ctx.ttfb_start = time.monotonic()
+
+        async def on_connection_reuse(session, ctx, params):
+            ctx.ttfb_start = time.monotonic()
+
+        async def on_request_end(session, ctx, params):
+            self.add(ctx.url, "ttfb", time.monotonic() - ctx.ttfb_start)
+
+        async def on_request_exception(session, ctx, params):
+            self.record(ctx.url, error=type(params.exception).__name__)
+
+        trace.on_request_start.append(on_request_start)
+        trace.on_dns_resolvehost_start.append(on_dns_start)
+        trace.on_dns_resolvehost_end.append(on_dns_end)
+        trace.on_connection_create_start.append(on_connect_start)
+        trace.on_connection_create_end.append(on_connect_end)
+        trace.on_connection_reuseconn.append(on_connection_reuse)
+        trace.on_request_end.append(on_request_end)
+        trace.on_request_exception.append(on_request_exception)
+        return trace
+
+    def rows(self) -> list[dict]:
+        """One dict per URL, with every phase present and a total."""
+        rows = []
+        for record in self.records.values():
+            row = {phase: record.get(phase, 0.0) for phase in PHASES}
+            row.update({k: v for k, v in record.items() if k not in PHASES})
+            row["total"] = round(sum(row[phase] for phase in PHASES), 4)
+            rows.append(row)
+        return rows
+
+    def summary(self) -> dict:
+        """Run totals per phase, and the slowest sources by summed time."""
+        rows = self.rows()
+        by_source = defaultdict(float)
+        for row in rows:
+            by_source[row.get("source") or "?"] += row["total"]
+        return {
+            "run_id": self.run_id,
+            "wall_seconds": round(time.monotonic() - self.started, 3),
+            "requests": len(rows),
+            "phase_seconds": {
+                phase: round(sum(row[phase] for row in rows), 3) for phase in PHASES
+            },
+            "slowest_sources": [
+                [source, round(seconds, 3)]
+                for source, seconds in sorted(by_source.items(), key=lambda kv: kv[1], reverse=True)[:10]
+            ],
+        }
+
+    def write_report(self, report_dir: Path | str = DEFAULT_REPORT_DIR) -> Path:
+        """Write summary and per-URL rows to <report_dir>/fetch-<run_id>.json."""
+        report_dir = Path(report_dir)
+        report_dir.mkdir(parents=True, exist_ok=True)
+        path = report_dir / f"fetch-{self.run_id}.json"
+        path.write_text(json.dumps({"summary": self.summary(), "requests": self.rows()}, indent=2))
+        return path
+
+    def print_summary(self, limit: int = 3):
+        """One line of phase totals and the slowest sources."""
+        summary = self.summary()
+        phases = ", ".join(
+            f"{phase} {seconds:.1f}s"
+            for phase, seconds in summary["phase_seconds"].items() if seconds >= 0.05
+        )
+        print(f"  Telemetry: {summary['requests']} requests in {summary['wall_seconds']:.1f}s"
+              + (f" ({phases})" if phases else ""))
+        slowest = ", ".join(f"{s} {t:.1f}s" for s, t in summary["slowest_sources"][:limit])
+        if slowest:
+            print(f"  Slowest sources: {slowest}")
@@ -0,0 +1,92 @@
+"""Side store for article full text.
+
+Article.full_text is kept here, keyed by article hash, instead of on the
+article itself. When articles are filtered out (cross-feed duplicates,
+below min_score, not picked for a section) their text is released at
+once, while the small slotted article records can linger in lists.
+"""
+
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterable, Iterator
+
+
+class TextHold:
+    """Article hashes whose text one caller is still working on (see TextStore.holding)."""
+
+    def __init__(self, holds: Counter):
+        self._holds = holds
+        self.hashes: list[str] = []
+
+    def add(self, article_hashes: Iterable[str]):
+        article_hashes = list(article_hashes)
+        self.hashes.extend(article_hashes)
+        self._holds.update(article_hashes)
+
+
+class TextStore:
+    """Full text by article hash.
+
+    Articles sharing a hash (one story, two feeds) share one text. Callers
+    that may work on the same hashes concurrently, like the fetch daemon's
+    polls, each take a hold; release() keeps held text, and a hold's text
+    goes when its last holder is done.
+    """
+
+    def __init__(self):
+        self._texts: dict[str, str] = {}
+        self._holds: Counter[str] = Counter()
+
+    def get(self, article_hash: str) -> str:
+        return self._texts.get(article_hash, "")
+
+    def set(self, article_hash: str, text: str):
+        if text:
+            self._texts[article_hash] = text
+        else:
+            self._texts.pop(article_hash, None)
+
+    def release(self, article_hashes: Iterable[str]) -> int:
+        """Drop the text of these articles, unless held; returns how many had any."""
+        return sum(
+            1 for h in article_hashes
+            if not self._holds[h] and self._texts.pop(h, None) is not None
+        )
+
+    @contextmanager
+    def holding(self, article_hashes: Iterable[str] = ()) -> Iterator[TextHold]:
+        """Hold these hashes' text (and any added to the hold) for the block.
+
+        Afterwards their text is released, except where another hold remains.
+        """
+        hold = TextHold(self._holds)
+        hold.add(article_hashes)
+        try:
+            yield hold
+        finally:
+            self._holds.subtract(hold.hashes)
+            self._holds += Counter()  # drop zero counts
+            self.release(hold.hashes)
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the stored strings."""
+        return sum(sys.getsizeof(text) for text in self._texts.values())
+
+
+# The store behind every Article.full_text
+TEXTS = TextStore()
+
+
+def release_filtered(before: Iterable, after: Iterable) -> int:
+    """Release the text of articles in before that aren't in after.
+
+    Matched by hash, so an article surviving under the same hash as a
+    dropped copy keeps its text.
+    """
+    kept = {a.article_hash for a in after}
+    return TEXTS.release(a.article_hash for a in before if a.article_hash not in kept)
@@ -7,6 +7,10 @@ from .reliability import (
     calculate_cross_reference_bonus,
     flag_low_reliability,
 )
+from .urls import canonicalize_url
+from .html_text import html_to_text
+from .dates import normalize_date
+from .keywords import KeywordMatcher
 
 __all__ = [
     "detect_language",
@@ -16,4 +20,8 @@ __all__ = [
     "get_reliability_score",
     "calculate_cross_reference_bonus",
     "flag_low_reliability",
+    "canonicalize_url",
+    "html_to_text",
+    "normalize_date",
+    "KeywordMatcher",
 ]
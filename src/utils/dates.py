@@ -0,0 +1,94 @@
+"""Publication date normalization for feed entries."""
+
+import time
+from datetime import datetime, timezone
+
+from dateutil import parser as date_parser
+
+# Formats tried before falling back to dateutil, most common in feeds first
+DATE_FORMATS = [
+    "%a, %d %b %Y %H:%M:%S %z",      # RFC 822: Tue, 14 Oct 2026 09:30:00 +0000
+    "%a, %d %b %Y %H:%M:%S %Z",      # RFC 822 with zone name: ... GMT
+    "%a, %d %b %Y %H:%M %z",
+    "%d %b %Y %H:%M:%S %z",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%dT%H:%M:%S.%fZ",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+]
+
+# Last format that parsed each source's dates; sources rarely change format
+_learned_formats: dict[str, str] = {}
+
+
+def _aware(dt: datetime) -> datetime:
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt
+
+
+def _parse_with_formats(value: str, source: str | None) -> datetime | None:
+    """Parse using the source's learned format first, then the known formats."""
+    learned = _learned_formats.get(source) if source else None
+    if learned:
+        try:
+            return datetime.strptime(value, learned)
+        except ValueError:
+            pass
+
+    # ISO 8601 covers Atom feeds and our own stored snapshots
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+
+    for fmt in DATE_FORMATS:
+        if fmt == learned:
+            continue
+        try:
+            dt = datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+        if source:
+            _learned_formats[source] = fmt
+        return dt
+    return None
+
+
+def normalize_date(
+    value: float | time.struct_time | str | None,
+    source: str | None = None,
+    fallback: datetime | None = None,
+) -> datetime:
+    """
+    Timezone-aware datetime for a feed entry's date.
+
+    value is an epoch timestamp or struct_time (feedparser's *_parsed, UTC),
+    or a raw date string. Strings go through the source's learned format,
+    then DATE_FORMATS, then dateutil. Missing or unparseable dates return
+    fallback, or now() if none is given.
+    """
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, timezone.utc)
+    if isinstance(value, time.struct_time):
+        return datetime(*value[:6], tzinfo=timezone.utc)
+
+    if value:
+        value = value.strip()
+        dt = _parse_with_formats(value, source)
+        if dt is not None:
+            return _aware(dt)
+        try:
+            return _aware(date_parser.parse(value))
+        except (ValueError, TypeError, OverflowError):
+            pass
+
+    return fallback or datetime.now(timezone.utc)
+
+
+def first_seen(fetched_at) -> datetime | None:
+    """Aware datetime of an article store fetched_at value (local time)."""
+    if not fetched_at:
+        return None
+    try:
+        return datetime.fromisoformat(str(fetched_at)).astimezone(timezone.utc)
+    except ValueError:
+        return None
@@ -0,0 +1,82 @@
+"""Fast HTML-to-text conversion for RSS summaries."""
+
+import re
+from html.parser import HTMLParser
+
+# Elements whose text BeautifulSoup's get_text() leaves out
+_SKIP_TAGS = {"script", "style", "template"}
+
+# Tag-like text left in the output means the stripper lost track of the markup
+_LEFTOVER_TAG = re.compile(r"<[a-zA-Z/!]")
+
+
+class _Enough(Exception):
+    """Raised to stop parsing once enough text has been collected."""
+
+
+class _TextCollector(HTMLParser):
+    """Collects text nodes, stopping once limit characters are gathered."""
+
+    def __init__(self, limit: int):
+        super().__init__(convert_charrefs=True)
+        self.limit = limit
+        self.parts: list[str] = []
+        self.size = 0
+        self.skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIP_TAGS:
+            self.skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in _SKIP_TAGS and self.skip_depth:
+            self.skip_depth -= 1
+
+    def handle_data(self, data):
+        if self.skip_depth:
+            return
+        self.parts.append(data)
+        self.size += len(data)
+        if self.size >= self.limit:
+            raise _Enough
+
+    def unknown_decl(self, data):
+        # CDATA sections count as text, as in BeautifulSoup
+        if data.startswith("CDATA["):
+            self.handle_data(data[6:])
+
+
+def _strip_tags(html: str, limit: int) -> str:
+    collector = _TextCollector(limit)
+    try:
+        collector.feed(html)
+        collector.close()
+    except _Enough:
+        pass
+    return "".join(collector.parts)[:limit]
+
+
+def html_to_text(html: str, limit: int = 500) -> str:
+    """
+    Plain text of an HTML fragment, truncated to limit characters.
+
+    Matches BeautifulSoup(html, "html.parser").get_text()[:limit] but
+    streams through the markup and stops once limit characters are
+    collected. Falls back to BeautifulSoup for input the stripper can't handle.
+    """
+    if not html:
+        return ""
+
+    # Plain text summaries need no parsing at all
+    if "<" not in html and "&" not in html:
+        return html[:limit]
+
+    try:
+        text = _strip_tags(html, limit)
+        if not _LEFTOVER_TAG.search(text) or _LEFTOVER_TAG.search(html) is None:
+            return text
+    except Exception:
+        pass
+
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(html, "html.parser").get_text()[:limit]
@@ -0,0 +1,136 @@
+"""Match a fixed set of keywords against many texts.
+
+KeywordMatcher is built once per keyword set and reports every keyword
+a text contains, case-insensitively, in one of two modes:
+
+    substring       kw occurs anywhere ("ai" matches "said"); the scoring
+                    rule calculate_base_score has always used
+    word_boundary   kw occurs with no word character on either side
+                    ("ai" matches "ai-driven", not "said")
+
+Word-boundary matching tokenizes the text once and only checks keywords
+whose first word is among its tokens. Substring matching runs one
+Aho-Corasick pass when pyahocorasick is installed, and otherwise one
+fast substring search per keyword; hits() makes that one pass over a
+whole batch of texts.
+"""
+
+import re
+from functools import lru_cache
+from itertools import chain
+from typing import Iterable
+
+import numpy as np
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+_WORD = re.compile(r"\w+")
+
+
+def _is_word_char(c: str) -> bool:
+    """Same test as the regex \\w."""
+    return c.isalnum() or c == "_"
+
+
+def _bounded(text: str, kw: str) -> bool:
+    """Whether kw occurs in text with no word character on either side."""
+    start = text.find(kw)
+    while start != -1:
+        end = start + len(kw)
+        before = start and _is_word_char(text[start - 1])
+        after = end < len(text) and _is_word_char(text[end])
+        if not (before or after):
+            return True
+        start = text.find(kw, start + 1)
+    return False
+
+
+class KeywordMatcher:
+    """The keywords a text contains, keywords compiled once."""
+
+    def __init__(self, keywords: Iterable[str], word_boundary: bool = False):
+        # Lowercased and deduplicated, first occurrence order
+        self.keywords = list(dict.fromkeys(kw.lower() for kw in keywords))
+        self.word_boundary = word_boundary
+
+        self._automaton = None
+        # First word of a keyword -> [(keyword, whether the token alone proves it)]
+        self._by_first_word: dict[str, list[tuple[str, bool]]] = {}
+        # Keywords with no word characters: checked against every text
+        self._wordless: list[str] = []
+
+        if word_boundary:
+            for kw in self.keywords:
+                words = _WORD.findall(kw)
+                if words:
+                    self._by_first_word.setdefault(words[0], []).append((kw, words == [kw]))
+                else:
+                    self._wordless.append(kw)
+        elif HAS_AHOCORASICK and any(self.keywords):
+            # Values are keyword indices
+            self._automaton = ahocorasick.Automaton()
+            for j, kw in enumerate(self.keywords):
+                if kw:
+                    self._automaton.add_word(kw, j)
+            self._automaton.make_automaton()
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def find(self, text: str) -> set[str]:
+        """Every keyword text contains."""
+        text = text.lower()
+        if self.word_boundary:
+            hits = {kw for kw in self._wordless if _bounded(text, kw)}
+            by_first_word = self._by_first_word
+            for word in by_first_word.keys() & set(_WORD.findall(text)):
+                for kw, is_word in by_first_word[word]:
+                    if is_word or _bounded(text, kw):
+                        hits.add(kw)
+            return hits
+        if self._automaton is not None:
+            keywords = self.keywords
+            hits = {keywords[j] for _, j in self._automaton.iter(text)}
+            if "" in keywords:  # in every text, like "" in text
+                hits.add("")
+            return hits
+        return set(filter(text.__contains__, self.keywords))
+
+    def hits(self, texts: list[str]) -> np.ndarray:
+        """(len(texts), len(keywords)) bool: hits[i, j] if texts[i] has keywords[j].
+
+        With Aho-Corasick, the texts are joined by NUL (which no keyword
+        spans) and scanned in one pass; each match's offset gives its text.
+        """
+        hits = np.zeros((len(texts), len(self.keywords)), dtype=bool)
+        if self._automaton is None or any("\0" in kw for kw in self.keywords):
+            column = {kw: j for j, kw in enumerate(self.keywords)}
+            for i, text in enumerate(texts):
+                hits[i, [column[kw] for kw in self.find(text)]] = True
+            return hits
+
+        # Lowercased before joining: lower() can change a text's length
+        texts = [text.lower() for text in texts]
+        # Offset one past each text's end, where its separator sits
+        ends = np.cumsum(np.fromiter(map(len, texts), np.int64, len(texts)) + 1) - 1
+        found = np.fromiter(chain.from_iterable(self._automaton.iter("\0".join(texts))), np.int64)
+        hits[np.searchsorted(ends, found[0::2]), found[1::2]] = True
+        if "" in self.keywords:
+            hits[:, self.keywords.index("")] = True
+        return hits
+
+    def search(self, text: str) -> bool:
+        """Whether text contains any keyword."""
+        if not self.word_boundary and self._automaton is None:
+            return any(map(text.lower().__contains__, self.keywords))
+        return bool(self.find(text))
+
+
+@lru_cache(maxsize=32)
+def keyword_matcher(keywords: tuple[str, ...], word_boundary: bool = False) -> KeywordMatcher:
+    """Shared matcher for a keyword set, for callers that score one text at a time."""
+    return KeywordMatcher(keywords, word_boundary)
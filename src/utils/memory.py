@@ -0,0 +1,47 @@
+"""Process memory readings, for per-stage reports."""
+
+import resource
+import sys
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # KB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def rss_mb() -> float:
+    """Current resident set size (the peak where /proc isn't available)."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return peak_rss_mb()
+    return pages * resource.getpagesize() / (1024 * 1024)
+
+
+class StageMemory:
+    """RSS and stored article text after each pipeline stage."""
+
+    def __init__(self):
+        self.stages: list[dict] = []
+
+    def mark(self, stage: str) -> dict:
+        from ..text_store import TEXTS
+
+        reading = {
+            "stage": stage,
+            "rss_mb": round(rss_mb(), 1),
+            "peak_rss_mb": round(peak_rss_mb(), 1),
+            "texts": len(TEXTS),
+            "text_mb": round(TEXTS.nbytes / (1024 * 1024), 2),
+        }
+        self.stages.append(reading)
+        return reading
+
+    def print_report(self):
+        print(f"  {'stage':<12} {'rss MB':>8} {'peak MB':>8} {'texts':>6} {'text MB':>8}")
+        for r in self.stages:
+            print(f"  {r['stage']:<12} {r['rss_mb']:>8.1f} {r['peak_rss_mb']:>8.1f}"
+                  f" {r['texts']:>6} {r['text_mb']:>8.2f}")
@@ -0,0 +1,101 @@
+"""URL normalization utilities."""
+
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track the click, never change the page
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid",
+    "ref_src", "cmpid", "ncid", "ocid", "taid", "sr_share",
+}
+
+
+# Query parameters requesting an AMP rendering of the same page, and the
+# values that do
+AMP_PARAMS = {"amp": {"", "1", "true"}, "outputtype": {"amp"}}
+
+# Sites (and their subdomains) that serve AMP copies under an AMP path form.
+# Elsewhere such paths are left alone: /amp or /amp.html may be a real page.
+AMP_PATH_HOSTS = {"bbc.co.uk", "bbc.com", "cnbc.com", "globalnews.ca", "theguardian.com"}
+
+# Host prefixes serving the same articles as the bare/www host
+_VARIANT_HOST = re.compile(r"^(?:www\d*|m|mobile|amp)\.")
+
+# AMP path forms: /amp/story, /story/amp, /story/amp.html, /story.amp(.html)
+_AMP_PREFIX = re.compile(r"^/amp(?=/)")
+_AMP_SUFFIX = re.compile(r"/amp(?:\.html)?/?$")
+_AMP_EXTENSION = re.compile(r"\.amp(\.html?)?$")
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name.startswith("utm_") or name in TRACKING_PARAMS
+
+
+def _is_amp_param(name: str, value: str) -> bool:
+    return value.lower() in AMP_PARAMS.get(name.lower(), ())
+
+
+def _serves_amp_paths(host: str, amp_host: bool) -> bool:
+    return amp_host or any(host == h or host.endswith(f".{h}") for h in AMP_PATH_HOSTS)
+
+
+def _canonical_path(path: str, strip_amp: bool) -> str:
+    if strip_amp:
+        path = _AMP_PREFIX.sub("", path)
+        path = _AMP_SUFFIX.sub("", path)
+        path = _AMP_EXTENSION.sub(lambda m: m.group(1) or "", path)
+    if len(path) > 1:
+        path = path.rstrip("/")
+    return path or "/"
+
+
+def canonicalize_url(url: str, collapse_variants: bool = True) -> str:
+    """
+    Normalize a URL so the same page maps to one key.
+
+    Lowercases scheme and host, drops default ports, fragments and
+    tracking query parameters. Returns the input unchanged if unparseable.
+
+    With collapse_variants (the default), also treats http and https as one,
+    strips www./m./amp. host prefixes, amp=1/outputType=amp query forms and
+    trailing slashes, and sorts the query, so syndicated and AMP/mobile
+    copies of a story share a key. AMP path forms (/amp/story, /story/amp,
+    story.amp.html) are stripped only on amp. hosts and AMP_PATH_HOSTS.
+    The result is an identity key, not a URL to fetch.
+    """
+    if not url:
+        return url
+
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if not scheme or not host:
+        return url
+
+    try:
+        port = parts.port
+    except ValueError:
+        return url
+    if port and not ((scheme == "http" and port == 80) or (scheme == "https" and port == 443)):
+        host = f"{host}:{port}"
+
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(k)
+    ]
+    path = parts.path or "/"
+
+    if collapse_variants:
+        if scheme == "http":
+            scheme = "https"
+        amp_host = host.startswith("amp.")
+        host = _VARIANT_HOST.sub("", host)
+        path = _canonical_path(path, _serves_amp_paths(host, amp_host))
+        query = sorted((k, v) for k, v in query if not _is_amp_param(k, v))
+
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
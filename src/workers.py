@@ -0,0 +1,65 @@
+"""Shared process pool for CPU-bound parsing off the event loop."""
+
+import asyncio
+import atexit
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional
+
+# Parsing is CPU-bound; more workers than cores only adds contention
+MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Get the shared process pool, creating it on first use.
+
+    Uses the spawn start method: the pool is usually created while the
+    event loop has helper threads running, which fork does not handle safely.
+    """
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=MAX_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+def _discard_process_pool(broken: ProcessPoolExecutor):
+    """Drop a broken pool, unless another caller already replaced it."""
+    global _pool
+    if _pool is broken:
+        _pool = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_in_process_pool(fn: Callable, *args):
+    """Run fn(*args) in the shared pool, off the event loop.
+
+    A worker that dies (OOM kill, parser segfault) breaks the whole pool
+    for every later call; the pool is then rebuilt and the call retried
+    once. Raises BrokenProcessPool if the retry breaks it too.
+    """
+    loop = asyncio.get_running_loop()
+    pool = get_process_pool()
+    try:
+        return await loop.run_in_executor(pool, fn, *args)
+    except BrokenProcessPool:
+        _discard_process_pool(pool)
+        print("  [WARN] Process pool broke (a worker died); restarting it")
+        return await loop.run_in_executor(get_process_pool(), fn, *args)
+
+
+def shutdown_process_pool():
+    """Shut down the shared process pool if it was started."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
+
+
+atexit.register(shutdown_process_pool)
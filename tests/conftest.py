@@ -0,0 +1,10 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# src.database initializes its file on import; keep tests off data/brief.db
+os.environ.setdefault("NEWS_DB_PATH", str(Path(tempfile.mkdtemp()) / "test.db"))
@@ -0,0 +1,100 @@
+"""BatchScorer gives calculate_base_score's scores, to the bit."""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from src.batch_scorer import BatchScorer
+from src.curator import calculate_base_score
+from src.fetcher import Article
+from src.utils import keywords
+
+CONFIG = {
+    "user_interests": {
+        "categories": {"tech_ai": 1.5, "finance": 1.2, "canada": 0.8},
+        "keywords": {
+            "high_priority": ["AI", "OpenAI", "interest rate"],
+            "medium_priority": ["Bank of Canada", "chip", "Montreal"],
+            "low_priority": ["startup", "election", "c++"],
+        },
+    },
+    "scoring": {"reliability_weight": 0.3, "high_reliability_bonus": 0.1},
+}
+
+LEARNED = {
+    "categories": {"tech_ai": 1.4, "canada": 0.6},
+    "keywords": {"nvidia": 2.5, "ai": 1.8, "housing": 0.3, "rate": 1.2},
+}
+
+WORDS = ("the market said officials new plan week data city year nvidia housing rate "
+         "AI openai interest rate chip montreal startup election c++ ai-driven said "
+         "Bank of Canada").split()
+
+TITLES = ("{} talks resume", "SHOCKING {} reveal", "7 WAYS {} changes work",
+          "Breaking: {} deal signed!", "You won't believe {}", "{} outlook")
+
+LINKS = ("https://example.com/news/", "https://arxiv.org/abs/", "https://www.reddit.com/r/x/", "")
+
+FULL_TEXTS = ("", 'He said "it is over" today.', "Prices rose 4.5 percent in May.",
+              "Up 12% on the year, $3 billion.", "word " * 150, "no data here")
+
+
+def corpus(now: datetime, n: int = 400) -> list[Article]:
+    rng = random.Random(11)
+    articles = []
+    for i in range(n):
+        summary = " ".join(rng.choices(WORDS, k=rng.randint(0, 25)))
+        articles.append(Article(
+            title=rng.choice(TITLES).format(rng.choice(WORDS)),
+            link=f"{rng.choice(LINKS)}{i}" if i % 7 else "",
+            summary=summary,
+            source="test",
+            # Minutes past the hour keep ages clear of the recency cut-offs
+            published=now - timedelta(hours=rng.randint(0, 20), minutes=rng.randint(5, 55)),
+            category=rng.choice(["tech_ai", "finance", "canada", "uncategorized"]),
+            language="en",
+            reliability=rng.choice([0.5, 0.75, 0.89, 0.9, 0.95]),
+            full_text=rng.choice(FULL_TEXTS),
+        ))
+    return articles
+
+
+@pytest.fixture(params=["substring", "word_boundary", "substring_no_automaton"])
+def config(request, monkeypatch):
+    if request.param == "substring_no_automaton":
+        monkeypatch.setattr(keywords, "HAS_AHOCORASICK", False)
+    keywords.keyword_matcher.cache_clear()
+    yield dict(CONFIG, scoring=dict(CONFIG["scoring"],
+                                    keyword_word_boundary=request.param == "word_boundary"))
+    keywords.keyword_matcher.cache_clear()
+
+
+@pytest.mark.parametrize("include_full_text", [True, False])
+@pytest.mark.parametrize("learned", [None, LEARNED])
+def test_scores_match_calculate_base_score(config, learned, include_full_text):
+    now = datetime.now(timezone.utc)
+    articles = corpus(now)
+
+    expected = [calculate_base_score(a, config, learned, include_full_text) for a in articles]
+    scores = BatchScorer(config, learned).score(articles, include_full_text, now)
+
+    assert scores.tolist() == expected
+
+
+def test_keyword_hits_match_find(config):
+    articles = corpus(datetime.now(timezone.utc))
+    matcher = BatchScorer(config, LEARNED).matcher
+    texts = [f"{a.title} {a.summary}" for a in articles] + ["", "İstanbul AI", "ai\0ai"]
+
+    hits = matcher.hits(texts)
+
+    assert hits.shape == (len(texts), len(matcher))
+    for row, text in zip(hits, texts):
+        assert {kw for kw, hit in zip(matcher.keywords, row) if hit} == matcher.find(text)
+
+
+def test_empty_batch():
+    assert BatchScorer(CONFIG, LEARNED).score([]).shape == (0,)
+    assert np.array_equal(keywords.KeywordMatcher(["ai"]).hits([]), np.zeros((0, 1), bool))
@@ -0,0 +1,55 @@
+"""Sharing semantics of the hash-keyed full-text store."""
+
+from src.text_store import TextStore
+
+
+def test_release_drops_text():
+    store = TextStore()
+    store.set("a", "text a")
+    store.set("b", "text b")
+
+    assert store.release(["a", "missing"]) == 1
+    assert store.get("a") == ""
+    assert store.get("b") == "text b"
+
+
+def test_release_keeps_held_text():
+    store = TextStore()
+    store.set("a", "shared story")
+
+    with store.holding(["a"]):
+        # Another caller done with its copy of the story
+        assert store.release(["a"]) == 0
+        assert store.get("a") == "shared story"
+
+    assert store.get("a") == ""
+    assert len(store) == 0
+
+
+def test_text_goes_with_last_holder():
+    store = TextStore()
+    store.set("a", "shared story")
+
+    with store.holding(["a"]):
+        with store.holding() as other:
+            store.set("b", "only other")
+            other.add(["a", "b"])
+        # The other hold is done: its own text goes, the shared text stays
+        assert store.get("b") == ""
+        assert store.get("a") == "shared story"
+
+    assert store.get("a") == ""
+
+
+def test_hold_released_on_error():
+    store = TextStore()
+    store.set("a", "text")
+
+    try:
+        with store.holding(["a"]):
+            raise RuntimeError
+    except RuntimeError:
+        pass
+
+    assert store.get("a") == ""
+    assert store.release(["a"]) == 0